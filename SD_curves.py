@@ -1,4 +1,8 @@
 from manim import *
+import models
+from sections import SectionedScene
+from dependencies import dependent_updater
+from mobjects import DashedSegment
 
 AX_HEIGHT = 10
 AX_WIDTH = 10
@@ -59,33 +63,16 @@ AX_CONFIG = {
 #         return plane.plot(self.f, x_range=self.x_range, use_smoothing=False, **config)
 
 
-class LinearFunction:
+class LinearFunction(models.LinearFunction):
     # y = k*x + b
+    # graphs of models.LinearFunction on a given plane
     def __init__(self, plane, k, b, x_range=None):
+        super().__init__(k, b, x_range, x_max=AX_WIDTH, y_max=AX_HEIGHT)
         self.plane = plane
-        self.f = lambda x: k*x + b
-        self.get_x = lambda y: (y - b)/k
-        if x_range is None:
-            # TODO: default: keep everything in (0, 0) to (AX_HEIGHT, AXWIDTH)
-            self.x_range = [0, AX_WIDTH]
-            pass
-        else:
-            self.x_range = x_range
 
     def get_graph(self, **config):
         return self.plane.plot(self.f, x_range=self.x_range, use_smoothing=False, **config)
 
-    def get_coords(self, x=None, y=None):
-        # return coordinates of a dot on the indifference curve
-        # given the x or y position of the dot
-        if x is not None and y is not None:
-            return (x, y)
-        if x is not None:
-            return (x, self.f(x))
-        if y is not None:
-            return (self.get_x(y), y)
-        return None
-    
     def get_pos(self, x=None, y=None):
         # return position of a dot on the indifference curve relative to given plane
         # given the x or y position of the dot
@@ -93,7 +80,7 @@ class LinearFunction:
 
 
 
-class DemandCurveIntro(Scene):
+class DemandCurveIntro(SectionedScene):
     """
     Demand Curve Introduction
 
@@ -101,37 +88,17 @@ class DemandCurveIntro(Scene):
     # Animation #1: moving along the demand curve
     # Animation #2: demand curve shifting
     """
-    def construct(self):
-        self.init() # +{dc, dc_graph, dc_label} -> {dc, dc_graph, dc_label}
-        # self.animation_1() # no change
-        self.animation_2() # no change
-
-    def clean(self):
-        for m in self.mobjects:
-            if m not in self.protected_mobjects:
-                self.remove(m)
-
-    def add_mobjects(self, *args, animation=FadeIn, **kwargs):
-        if self.FADE_ANIMATION_OFF and animation == FadeIn:
-            animation = None
-        if animation is None:
-            self.add(*args)
-        else:
-            self.play(animation(Group(*args)), **kwargs)
-
-    def remove_mobjects(self, *args, animation=FadeOut, **kwargs):
-        if self.FADE_ANIMATION_OFF and animation == FadeOut:
-            animation = None
-        if animation is not None:
-            self.play(animation(Group(*args)), **kwargs)
-        self.remove(*args)
+    # sections rendered by default (select others with `python sections.py ... --section N`)
+    # init: +{dc, dc_graph, dc_label} -> {dc, dc_graph, dc_label}
+    # animation_1, animation_2: no change
+    SECTIONS = (2, )
 
     def init(self):
         self.FADE_ANIMATION_OFF = False
 
         plane = Axes(**AX_CONFIG).shift(LEFT*2)
         plane_labels = plane.get_axis_labels(x_label="Q", y_label="P")
-        self.add(plane, plane_labels)
+        self.add(*self.mark_static(plane, plane_labels))
 
         dc = LinearFunction(plane, -1, 10, [3, 7])
         # sc = LinearFunction(1, 0, [3, 7])
@@ -144,23 +111,23 @@ class DemandCurveIntro(Scene):
 
         self.plane, self.dc, self.dc_graph, self.dc_label = plane, dc, dc_graph, dc_label
         # self.sc, self.sc_graph = sc, sc_graph
-        self.protected_mobjects = [self.plane, self.dc_graph, plane_labels, dc_label]
+        self.protect(plane, dc_graph, plane_labels, dc_label)
 
     def animation_1(self):
         # Animation #1: moving along the demand curve
         plane, dc, dc_graph, dc_label = self.plane, self.dc, self.dc_graph, self.dc_label
         x_tracker = ValueTracker(3.5)
         
-        line_to_x_axis = DashedLine().add_updater(lambda l: l.put_start_and_end_on(
+        line_to_x_axis = DashedSegment().add_updater(dependent_updater(lambda l: l.put_start_and_end_on(
             dc.get_pos(x=x_tracker.get_value()), 
             plane.c2p(x_tracker.get_value(), 0)
+        ), x_tracker))
+        dot = Dot().add_updater(dependent_updater(
+            lambda d: d.move_to(dc.get_pos(x=x_tracker.get_value())), x_tracker
+        ))
+        q_label = Text("Q").scale(.5).add_updater(dependent_updater(
+            lambda t: t.next_to(plane.c2p(x_tracker.get_value(), 0), DOWN), x_tracker
         ))
-        dot = Dot().add_updater(
-            lambda d: d.move_to(dc.get_pos(x=x_tracker.get_value()))
-        )
-        q_label = Text("Q").scale(.5).add_updater(
-            lambda t: t.next_to(plane.c2p(x_tracker.get_value(), 0), DOWN)
-        )
         self.add(line_to_x_axis, q_label, dot)
 
         for x in [6.5, 3.5]:
@@ -176,7 +143,7 @@ class DemandCurveIntro(Scene):
         self.play(dc_graph.animate.shift(RIGHT), dc_label.animate.shift(RIGHT))
 
         
-class SupplyCurveIntro(Scene):
+class SupplyCurveIntro(SectionedScene):
     """
     Demand Curve Introduction
 
@@ -184,37 +151,17 @@ class SupplyCurveIntro(Scene):
     # Animation #1: moving along the supply curve
     # Animation #2: supply curve shifting
     """
-    def construct(self):
-        self.init() # +{sc, sc_graph, sc_label} -> {sc, sc_graph, sc_label}
-        # self.animation_1() # no change
-        self.animation_2() # no change
-
-    def clean(self):
-        for m in self.mobjects:
-            if m not in self.protected_mobjects:
-                self.remove(m)
-
-    def add_mobjects(self, *args, animation=FadeIn, **kwargs):
-        if self.FADE_ANIMATION_OFF and animation == FadeIn:
-            animation = None
-        if animation is None:
-            self.add(*args)
-        else:
-            self.play(animation(Group(*args)), **kwargs)
-
-    def remove_mobjects(self, *args, animation=FadeOut, **kwargs):
-        if self.FADE_ANIMATION_OFF and animation == FadeOut:
-            animation = None
-        if animation is not None:
-            self.play(animation(Group(*args)), **kwargs)
-        self.remove(*args)
+    # sections rendered by default (select others with `python sections.py ... --section N`)
+    # init: +{sc, sc_graph, sc_label} -> {sc, sc_graph, sc_label}
+    # animation_1, animation_2: no change
+    SECTIONS = (2, )
 
     def init(self):
         self.FADE_ANIMATION_OFF = False
 
         plane = Axes(**AX_CONFIG).shift(LEFT*2)
         plane_labels = plane.get_axis_labels(x_label="Q", y_label="P")
-        self.add(plane, plane_labels)
+        self.add(*self.mark_static(plane, plane_labels))
 
         sc = LinearFunction(plane, 1, 0, [3, 7])
 
@@ -225,23 +172,23 @@ class SupplyCurveIntro(Scene):
 
         self.plane, self.sc, self.sc_graph, self.sc_label = plane, sc, sc_graph, sc_label
         # self.sc, self.sc_graph = sc, sc_graph
-        self.protected_mobjects = [self.plane, self.sc_graph, plane_labels, sc_label]
+        self.protect(plane, sc_graph, plane_labels, sc_label)
 
     def animation_1(self):
         # Animation #1: moving along the supply curve
         plane, sc, sc_graph, sc_label = self.plane, self.sc, self.sc_graph, self.sc_label
         x_tracker = ValueTracker(3.5)
         
-        line_to_x_axis = DashedLine().add_updater(lambda l: l.put_start_and_end_on(
+        line_to_x_axis = DashedSegment().add_updater(dependent_updater(lambda l: l.put_start_and_end_on(
             sc.get_pos(x=x_tracker.get_value()), 
             plane.c2p(x_tracker.get_value(), 0)
+        ), x_tracker))
+        dot = Dot().add_updater(dependent_updater(
+            lambda d: d.move_to(sc.get_pos(x=x_tracker.get_value())), x_tracker
+        ))
+        q_label = Text("Q").scale(.5).add_updater(dependent_updater(
+            lambda t: t.next_to(plane.c2p(x_tracker.get_value(), 0), DOWN), x_tracker
         ))
-        dot = Dot().add_updater(
-            lambda d: d.move_to(sc.get_pos(x=x_tracker.get_value()))
-        )
-        q_label = Text("Q").scale(.5).add_updater(
-            lambda t: t.next_to(plane.c2p(x_tracker.get_value(), 0), DOWN)
-        )
         self.add(line_to_x_axis, q_label, dot)
 
         for x in [6.5, 3.5]:
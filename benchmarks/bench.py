@@ -0,0 +1,209 @@
+"""
+Benchmarks of the hot paths of the scenes
+
+    python benchmarks/bench.py [--only models graphs renders] [--threshold .2] [--save-baseline]
+
+models:  model construction without Manim (BudgetConstraint, vectorized IndifferenceCurve)
+graphs:  IndifferenceCurve.get_graph (cold and cached), BudgetConstraint.__init__ and
+         get_all_graphs, BudgetConstraintGraphs.set_params, LinearFunction.get_graph,
+         TrackerTable.prepare, repositioning a DashedLine and a DashedSegment
+renders: for each scene of demand_curve.py, expected_utility_theory.py and SD_curves.py,
+         the wall time of a full low quality render (headless manim process) and the
+         updater time per frame (from a second, profiled render, see profiler.py)
+
+results (seconds) are written to benchmarks/results.json and compared with
+benchmarks/baseline.json: a benchmark more than `threshold` slower than its
+baseline is a regression (exit code 1). benchmarks without a baseline are
+listed as such; when none of them has one (e.g. no baseline.json) there is
+nothing to compare and the exit code is 2. --save-baseline adds the results to
+the baseline. timings depend on the machine: the baseline records the machine
+it was saved on, and comparisons on another one are flagged. groups that need
+Manim are skipped when it isn't installed
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scene_index import find_scenes
+
+RESULTS_PATH = os.path.join(ROOT, "benchmarks", "results.json")
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+RENDER_MODULES = ("demand_curve.py", "expected_utility_theory.py", "SD_curves.py")
+
+PX, PY, BUDGET = 2, 2, 12
+
+
+def time_call(function, repeat=5):
+    # seconds per call: best of `repeat` runs, each long enough (~0.2 s) to time
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number))/number
+
+
+def bench_models():
+    import numpy as np
+    import models
+
+    xs = np.linspace(.1, 10, 1000)
+    ic = models.IndifferenceCurve(3)
+    return {
+        "models.BudgetConstraint": time_call(lambda: models.BudgetConstraint(PX, PY, BUDGET)),
+        "models.IndifferenceCurve.f (1000 x)": time_call(lambda: ic.f(xs)),
+        "models.BudgetConstraint (1000 prices)": time_call(lambda: models.BudgetConstraint(xs, PY, BUDGET).tan_pos),
+    }
+
+
+def bench_graphs():
+    from manim import Axes, DashedLine, ValueTracker
+    from curves import IndifferenceCurve, BudgetConstraint
+    from demand_curve import AX_CONFIG
+    from mobjects import BudgetConstraintGraphs, DashedSegment
+    from plotting import coords_to_points
+    from SD_curves import LinearFunction
+    from timeline import TrackerTable
+
+    plane = Axes(**AX_CONFIG)
+    ic = IndifferenceCurve(3)
+    bc = BudgetConstraint(PX, PY, BUDGET)
+
+    def get_graph_cold():
+        IndifferenceCurve.point_cache.clear()
+        ic.get_graph(plane)
+
+    bc_graphs = BudgetConstraintGraphs(plane, bc)
+    dashed_line, dashed_segment = DashedLine(), DashedSegment()
+    start, end = plane.c2p(3, 4), plane.c2p(3, 0)
+    table = TrackerTable(ValueTracker(1), pos=lambda xs: coords_to_points(plane, xs, ic.f(xs)), mrs=ic.get_slope)
+    return {
+        "IndifferenceCurve.get_graph (cold)": time_call(get_graph_cold),
+        "IndifferenceCurve.get_graph (cached)": time_call(lambda: ic.get_graph(plane)),
+        "BudgetConstraint.__init__": time_call(lambda: BudgetConstraint(PX, PY, BUDGET)),
+        "BudgetConstraint.get_all_graphs": time_call(lambda: bc.get_all_graphs(plane)),
+        "BudgetConstraintGraphs.set_params": time_call(lambda: bc_graphs.set_params(px=PX + 1)),
+        "LinearFunction.get_graph": time_call(lambda: LinearFunction(plane, -1, 8).get_graph()),
+        "TrackerTable.prepare (2 s)": time_call(lambda: table.prepare(5, run_time=2)),
+        "DashedLine.put_start_and_end_on": time_call(lambda: dashed_line.put_start_and_end_on(start, end)),
+        "DashedSegment.put_start_and_end_on": time_call(lambda: dashed_segment.put_start_and_end_on(start, end)),
+    }
+
+
+def render(path, scene, media_dir, profile_dir=None):
+    # seconds of a low quality render of `scene`
+    env = dict(os.environ)
+    # times only: tracing allocations would inflate them
+    env.pop("RENDER_PROFILE_MEMORY", None)
+    if profile_dir:
+        env["RENDER_PROFILE"] = profile_dir
+    command = [
+        sys.executable, "-m", "manim", "render", "-ql", "--disable_caching", "--progress_bar", "none",
+        "--media_dir", media_dir, path, scene
+    ]
+    start = time.perf_counter()
+    subprocess.run(command, cwd=ROOT, env=env, check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def get_updater_time_per_frame(profile_path):
+    with open(profile_path) as f:
+        report = json.load(f)
+    total = sum(row["total_s"] for row in report["rows"] if row["kind"] == "updater")
+    return total/max(report["frames"], 1)
+
+
+def bench_renders():
+    import manim # only to skip the group without manim
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in RENDER_MODULES:
+            for scene, _ in find_scenes(os.path.join(ROOT, path)):
+                results[f"render {scene}"] = render(path, scene, os.path.join(tmp, "media"))
+                profile_dir = os.path.join(tmp, "profiles")
+                render(path, scene, os.path.join(tmp, "media"), profile_dir)
+                profile_path = os.path.join(profile_dir, f"{scene}.json")
+                if os.path.exists(profile_path): # scenes deriving from ProfiledScene
+                    results[f"updaters per frame {scene}"] = get_updater_time_per_frame(profile_path)
+    return results
+
+
+GROUPS = {"models": bench_models, "graphs": bench_graphs, "renders": bench_renders}
+
+
+def get_machine():
+    return {"python": platform.python_version(), "machine": platform.machine(), "processor": platform.processor()}
+
+
+def compare(results, baseline, threshold):
+    # lines of the report, whether any benchmark regressed, and the names of those without a baseline
+    lines = [f"{'benchmark':<48}{'seconds':>12}{'baseline':>12}{'change':>9}"]
+    regressed = False
+    missing = []
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if base is None:
+            missing.append(name)
+            lines.append(f"{name:<48}{seconds:>12.3g}{'-':>12}{'':>9}  no baseline")
+            continue
+        change = seconds/base - 1
+        flag = ""
+        if change > threshold:
+            regressed = True
+            flag = "  REGRESSION"
+        lines.append(f"{name:<48}{seconds:>12.3g}{base:>12.3g}{change:>+9.0%}{flag}")
+    return lines, regressed, missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="*", choices=list(GROUPS), default=list(GROUPS))
+    parser.add_argument("--threshold", type=float, default=.2, help="allowed slowdown, .2 = 20%%")
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    results = {}
+    for group in args.only:
+        try:
+            results.update(GROUPS[group]())
+        except ImportError as e:
+            print(f"skipped {group}: {e}")
+
+    with open(RESULTS_PATH, "w") as f:
+        json.dump({**get_machine(), "results": results}, f, indent=2)
+        f.write("\n")
+
+    baseline, baseline_machine = {}, None
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            saved = json.load(f)
+        baseline, baseline_machine = saved["results"], saved.get("machine")
+    lines, regressed, missing = compare(results, baseline, args.threshold)
+    print("\n".join(lines))
+    if baseline_machine is not None and baseline_machine != get_machine():
+        print(f"baseline saved on another machine ({baseline_machine}), timings may not compare")
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump({"machine": get_machine(), "results": {**baseline, **results}}, f, indent=2)
+            f.write("\n")
+        print(f"baseline saved to {BASELINE_PATH}")
+        return 0
+    if missing:
+        print(f"{len(missing)} of {len(results)} benchmarks have no baseline (python benchmarks/bench.py --save-baseline)")
+    if results and len(missing) == len(results):
+        return 2
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
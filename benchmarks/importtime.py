@@ -0,0 +1,64 @@
+"""
+Import time of the modules that must stay light (no Manim import)
+
+    python benchmarks/importtime.py [--update]
+
+runs `python -X importtime -c "import <module>"` for each module, prints the
+cumulative import time and fails if a module imports Manim or exceeds its budget;
+--update also writes the report to benchmarks/importtime.txt
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = os.path.join(ROOT, "benchmarks", "importtime.txt")
+
+# module: budget in ms (numpy alone takes ~100 ms)
+BUDGETS = {
+    "models": 300,
+    "plotting": 300,
+    "curves": 300,
+    "scene_index": 100,
+}
+
+
+def get_import_times(module):
+    # {imported package: cumulative import time in us} of `import module` in a fresh interpreter
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], 
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, package = line[len("import time:"):].split("|")
+        times[package.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    lines = [f"{'module':<16}{'ms':>10}{'budget':>10}  manim"]
+    failed = False
+    for module, budget in BUDGETS.items():
+        times = get_import_times(module)
+        ms = times[module]/1000
+        imports_manim = any(package.split(".")[0] == "manim" for package in times)
+        failed |= imports_manim or ms > budget
+        lines.append(f"{module:<16}{ms:>10.1f}{budget:>10}  {'yes' if imports_manim else 'no'}")
+
+    report = "\n".join(lines)
+    print(report)
+    if "--update" in sys.argv:
+        with open(REPORT_PATH, "w") as f:
+            f.write(report + "\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+Curves shared by the scenes: the models (see `models`) and their graphs
+
+Manim is only imported when a graph is made, so importing these classes is cheap
+"""
+
+import numpy as np
+
+import models
+from plotting import (
+    CurvePointCache, get_plot_step, get_plot_xs, get_inner_slice, get_pixel_size, 
+    get_adaptive_coords, coords_to_points, corners_to_bezier_points, get_graph_from_points
+)
+
+AX_HEIGHT = 10
+AX_WIDTH = 10
+
+
+class IndifferenceCurve(models.IndifferenceCurve):
+    # utility function: u = sqrt(x*y)
+    # y = u^2/x
+    # graphs of models.IndifferenceCurve
+
+    # sampled graph points shared by all indifference curves
+    # u is rounded to U_DECIMALS in the cache key (well below a pixel), 
+    # so sweeping u back and forth reuses graphs computed before
+    point_cache = CurvePointCache(max_size=512)
+    U_DECIMALS = 3
+
+    # max on-screen error of graphs in pixels, for adaptive sampling
+    # (None: uniform x steps like plane.plot)
+    ADAPTIVE_TOLERANCE = 1
+
+    # reference curve u=1 (y = 1/x) sampled on a fixed grid, for each plot step
+    reference_coords = {}
+    # reference curve sampled adaptively, for each plane scale, tolerance, octave of u and bounds
+    adaptive_reference_coords = {}
+
+    def __init__(self, u, use_family=True, x_max=AX_WIDTH, y_max=AX_HEIGHT):
+        super().__init__(u, x_max=x_max, y_max=y_max)
+        self.x_max, self.y_max = x_max, y_max
+        # analytic family mode: compute samples from the reference curve 
+        # instead of calling self.f for each sample
+        self.use_family = use_family
+
+    def get_graph(self, plane, **config):
+        return get_graph_from_points(self.get_graph_points(plane), **config)
+        # return plane.plot(self.f, x_range=self.x_range, use_smoothing=False, **config)
+
+    def get_graph_points(self, plane):
+        # bezier points of the graph, from point_cache (read-only, shared by all graphs of this u)
+        step = get_plot_step(plane)
+        tolerance = self.ADAPTIVE_TOLERANCE
+        ic = IndifferenceCurve(round(self.u, self.U_DECIMALS), self.use_family, self.x_max, self.y_max)
+        key = (
+            ic.u, tuple(ic.x_range), CurvePointCache.get_plane_key(plane), 
+            step, tolerance, get_pixel_size()
+        )
+        return self.point_cache.get(key, lambda: ic.get_points(plane, step, tolerance))
+
+    def get_points(self, plane, step, tolerance=None):
+        # bezier points of the graph
+        # adaptive samples if tolerance is given, 
+        # otherwise sampled like plane.plot(..., use_smoothing=False);
+        # in family mode both are scaled from samples of the reference curve
+        if self.use_family and tolerance is not None:
+            xs, ys = self.get_adaptive_family_coords(plane, tolerance)
+        elif self.use_family:
+            xs, ys = self.get_family_coords(step)
+        elif tolerance is not None:
+            # self.f works on numpy arrays, one call per refinement pass
+            xs, ys = get_adaptive_coords(self.f, self.x_range, plane, tolerance)
+        else:
+            xs = get_plot_xs(self.x_range, step)
+            ys = [self.f(x) for x in xs]
+        return corners_to_bezier_points(coords_to_points(plane, xs, ys))
+
+    @classmethod
+    def get_reference_coords(cls, step):
+        if step not in cls.reference_coords:
+            xs = np.arange(step, AX_WIDTH, step)
+            cls.reference_coords[step] = xs, 1/xs
+        return cls.reference_coords[step]
+
+    def get_family_coords(self, step):
+        # every indifference curve is the reference curve y = 1/x scaled by u^2 along y
+        # samples: both ends of x_range and the reference grid in between
+        ref_xs, ref_ys = self.get_reference_coords(step)
+        inner = get_inner_slice(ref_xs, self.x_range)
+        x_min, x_max = self.x_range
+        xs = np.concatenate(([x_min], ref_xs[inner], [x_max]))
+        ys = self.u**2*np.concatenate(([1/x_min], ref_ys[inner], [1/x_max]))
+        return xs, ys
+
+    def get_adaptive_reference_coords(self, plane, tolerance):
+        # adaptive samples s of the reference curve y = 1/x for this curve's octave of u:
+        # (u*s, u/s) is on the curve u, and scaling both coordinates by u scales
+        # on-screen errors by u, so sampling with tolerance/2**octave keeps every
+        # curve of the octave (2**(octave - 1) < u <= 2**octave) within tolerance
+        octave = int(np.ceil(np.log2(self.u)))
+        key = (
+            CurvePointCache.get_plane_key(plane), tolerance, get_pixel_size(), 
+            octave, self.x_max, self.y_max
+        )
+        if key not in self.adaptive_reference_coords:
+            # s range of the curves of the octave: [u^2/y_max, x_max]/u
+            u_min = 2.**(octave - 1)
+            s_range = [u_min/self.y_max, self.x_max/u_min]
+            self.adaptive_reference_coords[key] = get_adaptive_coords(
+                lambda s: 1/s, s_range, plane, tolerance/2.**octave
+            )
+        return self.adaptive_reference_coords[key]
+
+    def get_adaptive_family_coords(self, plane, tolerance):
+        # adaptive samples of the reference curve scaled by u along both axes,
+        # between both ends of x_range
+        ref_ss, ref_ys = self.get_adaptive_reference_coords(plane, tolerance)
+        ref_xs = self.u*ref_ss
+        inner = get_inner_slice(ref_xs, self.x_range)
+        x_min, x_max = self.x_range
+        xs = np.concatenate(([x_min], ref_xs[inner], [x_max]))
+        ys = np.concatenate(([self.f(x_min)], self.u*ref_ys[inner], [self.f(x_max)]))
+        return xs, ys
+
+    def get_pos(self, plane, x=None, y=None):
+        # return position of a dot on the indifference curve relative to given plane
+        # given the x or y position of the dot
+        return plane.c2p(*self.get_coords(x, y))
+
+
+class BudgetConstraint(models.BudgetConstraint):
+    # graphs of models.BudgetConstraint
+    indifference_curve_class = IndifferenceCurve
+
+    def __init__(self, px, py, budget):
+        super().__init__(px, py, budget, x_max=AX_WIDTH, y_max=AX_HEIGHT)
+
+    def get_pos(self, plane, x=None, y=None):
+        # return position of a dot on the budget constraint line relative to given plane
+        # given the x or y position of the dot
+        return plane.c2p(*self.get_coords(x, y))
+
+    def get_graph(self, plane):
+        return plane.plot(self.f, x_range=self.x_range, use_smoothing=False)
+
+    def get_ic(self, plane):
+        return self.ic
+
+    def get_ic_graph(self, plane, **kwargs):
+        from manim import BLUE
+        return self.get_ic(plane).get_graph(plane, color=BLUE, **kwargs)
+
+    def get_all_graphs(self, plane):
+        bc_graph = self.get_graph(plane)
+        ic_graph = self.get_ic_graph(plane)
+        from manim import Dot, VGroup
+        optimal_point_dot = Dot(point=plane.c2p(*self.tan_pos))
+        
+        return VGroup(bc_graph, ic_graph, optimal_point_dot)
@@ -1,4 +1,14 @@
 from manim import *
+from curves import IndifferenceCurve, BudgetConstraint
+from mobjects import (
+    TracedCurve, UtilityContours, Readout, DashedSegment, 
+    IndifferenceCurveGraph, BudgetConstraintGraph, BudgetConstraintGraphs
+)
+from frame_parallel import FrameRangeScene
+from sections import SectionedScene
+from plotting import coords_to_points
+from timeline import TrackerTable
+from dependencies import dependent_updater
 
 AX_HEIGHT = 10
 AX_WIDTH = 10
@@ -16,93 +26,7 @@ PY = 2
 BUDGET = 12 # budget
 
 
-class IndifferenceCurve:
-    # utility function: u = sqrt(x*y)
-    # y = u^2/x
-    def __init__(self, u):
-        self.u = u
-        self.f = lambda x: u**2/x
-        self.x_range = [self.u**2/AX_HEIGHT, AX_WIDTH]
-
-    def get_graph(self, plane, **config):
-        return plane.plot(self.f, x_range=self.x_range, use_smoothing=False, **config)
-        # return plane.plot(self.f, x_range=self.x_range, use_smoothing=False, **config)
-
-    def get_x(self, y):
-        return self.u**2/y
-
-    def get_coords(self, x=None, y=None):
-        # return coordinates of a dot on the indifference curve
-        # given the x or y position of the dot
-        if x is not None and y is not None:
-            return (x, y)
-        if x is not None:
-            return (x, self.f(x))
-        if y is not None:
-            return (self.get_x(y), y)
-        return None
-    
-    def get_pos(self, plane, x=None, y=None):
-        # return position of a dot on the indifference curve relative to given plane
-        # given the x or y position of the dot
-        return plane.c2p(*self.get_coords(x, y))
-
-
-class BudgetConstraint:
-    def __init__(self, px, py, budget):
-        # prices for good x and y
-        self.px = px
-        self.py = py
-        self.budget = budget
-
-        # graph
-        k = -px/py
-        b = budget/py
-        self.k, self.b = k, b
-        self.f = lambda x: x*k + b
-        self.x_range = [max((AX_HEIGHT - b)/k, 0), min(self.budget/self.px, AX_WIDTH)]
-
-        # indifference curve
-        self.u = b/(2*np.sqrt(-k))
-        
-        # optimal (tangent) point
-        _x = budget/px/2
-        self.tan_pos = _x, self.f(_x)
-
-    def get_coords(self, x=None, y=None):
-        # return coordinates of a dot on the budget constraint line
-        # given the x or y position of the dot
-        if x is not None and y is not None:
-            return (x, y)
-        if x is not None:
-            return (x, self.f(x))
-        if y is not None:
-            return ((y - self.b)/self.k, y)
-        return None
-    
-    def get_pos(self, plane, x=None, y=None):
-        # return position of a dot on the budget constraint line relative to given plane
-        # given the x or y position of the dot
-        return plane.c2p(*self.get_coords(x, y))
-
-    def get_graph(self, plane):
-        return plane.plot(self.f, x_range=self.x_range, use_smoothing=False)
-
-    def get_ic(self, plane):
-        return IndifferenceCurve(self.u)
-
-    def get_ic_graph(self, plane, **kwargs):
-        return self.get_ic(plane).get_graph(plane, color=BLUE, **kwargs)
-
-    def get_all_graphs(self, plane):
-        bc_graph = self.get_graph(plane)
-        ic_graph = self.get_ic_graph(plane)
-        optimal_point_dot = Dot(point=plane.c2p(*self.tan_pos))
-        
-        return VGroup(bc_graph, ic_graph, optimal_point_dot)
-
-
-class BudgetConstraintIntro(Scene):
+class BudgetConstraintIntro(SectionedScene):
     """
     Budget Constraint Introduction
 
@@ -111,29 +35,41 @@ class BudgetConstraintIntro(Scene):
         of good y (Qy=2) changing as budget changes
     (showing that Qx increases when Px decreases; lower price = more goods)
     """
-    def construct(self):
+    # animation_1: +{dot} -> {dot}
+    # animation_2: no change
+    SECTIONS = (1, 2)
+
+    def init(self):
         # Qx-Qy plane
         plane = NumberPlane(**AX_CONFIG).shift(LEFT*2)
         labels = plane.get_axis_labels(x_label="Q_x", y_label="Q_y")
-        self.add(plane, labels)
+        self.add(*self.mark_static(plane, labels))
 
         bc = BudgetConstraint(PX, PY, BUDGET)
 
         p_tracker = ValueTracker(PX)
 
-        bc_graph = bc.get_graph(plane)
-        bc_graph.add_updater(
-            lambda l: l.become(BudgetConstraint(p_tracker.get_value(), PY, BUDGET).get_graph(plane))
-        )
+        # budget line for the current Px, its points rewritten in place
+        bc_graph = BudgetConstraintGraph(plane, bc)
+        bc_graph.add_updater(dependent_updater(
+            lambda l: l.set_params(px=p_tracker.get_value()), p_tracker
+        ))
+        self.add(bc_graph)
 
-        # Animation #1: budget constraint changing in response to price change of good x (Px)
-        dot = Dot(bc_graph.get_start()).add_updater(
-            lambda d: d.move_to(bc.get_pos(plane, x=x_tracker.get_value()))
-        )
+        self.plane, self.bc, self.bc_graph = plane, bc, bc_graph
+        self.p_tracker = p_tracker
 
-        self.add(bc_graph, dot)
+    def animation_1(self):
+        # Animation #1: budget constraint changing in response to price change of good x (Px)
+        plane, bc, bc_graph = self.plane, self.bc, self.bc_graph
 
         x_tracker = ValueTracker(0)
+        dot = Dot(bc_graph.get_start()).add_updater(dependent_updater(
+            lambda d: d.move_to(bc.get_pos(plane, x=x_tracker.get_value())), x_tracker
+        ))
+
+        self.add(dot)
+
         # x_values = (bc.x_range[1], bc.get_coords(y=2)[0])
         x_values = (bc.x_range[1], bc.x_range[1]/2)
         for x in x_values:
@@ -143,30 +79,39 @@ class BudgetConstraintIntro(Scene):
             )
         self.wait()
 
+        self.dot = dot
+
+    def animation_2(self):
         # Animation #2: consumption bundle with fixed consumption 
         #   of good y (Qy=2) changing as budget changes
+        plane, bc, dot = self.plane, self.bc, self.dot
+        p_tracker = self.p_tracker
+
+        # bundle with Qy=2 and optimal Qx, for every frame of each play
+        # (models.BudgetConstraint works on arrays of prices)
+        p_table = TrackerTable(
+            p_tracker, 
+            pos=lambda pxs: coords_to_points(plane, *BudgetConstraint(pxs, PY, BUDGET).get_coords(y=2)), 
+            qx=lambda pxs: BudgetConstraint(pxs, PY, BUDGET).tan_pos[0]
+        )
+
         init_dot_pos = bc.get_pos(plane, y=2)
         dot.clear_updaters()
-        dot.add_updater(lambda d: d.move_to(
-            BudgetConstraint(p_tracker.get_value(), PY, BUDGET).get_pos(plane, y=2)
-        ))
+        dot.add_updater(dependent_updater(lambda d: d.move_to(p_table.get("pos")), p_tracker))
 
         # line from dot to y axis (Q_y)
         dot_to_y_ax_line = plane.get_lines_to_point(init_dot_pos)[0].set_color(YELLOW)
-        dot_to_y_ax_line.add_updater(lambda l: l.put_start_and_end_on(
-            plane.c2p(0, 2), 
-            BudgetConstraint(p_tracker.get_value(), PY, BUDGET).get_pos(plane, y=2)
-        ))
+        dot_to_y_ax_line.add_updater(dependent_updater(lambda l: l.put_start_and_end_on(
+            plane.c2p(0, 2), p_table.get("pos")
+        ), p_tracker))
 
         # Variable displaying current price
-        p_var = Variable(bc.px, "P_x", num_decimal_places=3)
-        q_var = Variable(bc.tan_pos[0], 'Q_x', num_decimal_places=3)
+        p_var = Readout(bc.px, "P_x", num_decimal_places=3)
+        q_var = Readout(bc.tan_pos[0], 'Q_x', num_decimal_places=3)
 
         # Group(p_var, q_var).arrange(DOWN)
-        p_var.add_updater(lambda v: v.tracker.set_value(p_tracker.get_value()))
-        q_var.add_updater(lambda v: v.tracker.set_value(
-            BudgetConstraint(p_tracker.get_value(), PY, BUDGET).tan_pos[0]
-        ))
+        p_var.add_updater(dependent_updater(lambda v: v.tracker.set_value(p_tracker.get_value()), p_tracker))
+        q_var.add_updater(dependent_updater(lambda v: v.tracker.set_value(p_table.get("qx")), p_tracker))
 
         # p_arrow denoting the direction price is changing (up = price increasing)
         # q_arrow denoting the direction of change for quantity
@@ -189,12 +134,12 @@ class BudgetConstraintIntro(Scene):
                     Rotate(q_arrow, angle=PI)
                 )
 
-            self.play(p_tracker.animate.set_value(p), run_time=2)
+            p_table.play(self, p, run_time=2)
 
         self.wait()
 
 
-class IndifferenceCurveIntro(Scene):
+class IndifferenceCurveIntro(SectionedScene):
     """
     Indifference Curve Introduction
     
@@ -207,88 +152,70 @@ class IndifferenceCurveIntro(Scene):
         (illustraiting diminishing marginal rate of substitution)
     Animation #5: deriving MRS formulas; MRS changing with Qx
     Animation #6: showing corresponding budget constraint
+    Animation #7: indifference map, color showing utility (darker = higher utility)
     """
-    def construct(self):
-        self.init()
-        # set of new mobjects added/deleted to self -> 
-        #   set of all mobjects added (exclude those imposed by self.init)
-
-        self.animation_1() # +{dot, u_var} -> {dot, u_var}
-        self.animation_2() # -{dot, u_var} -> {}
-        # self.clean()
-        # self.animation_3() # no change
-        # self.clean()
-        # self.animation_4() # no change
-        # self.clean()
-        # self.animation_5() # no change
-        # self.clean()
-        # self.animation_6() # no change
-        # self.clean()
+    # sections rendered by default (select others with `python sections.py ... --section N`)
+    # set of new mobjects added/deleted to self -> 
+    #   set of all mobjects added (exclude those imposed by self.init)
+    # animation_1: +{dot, u_var} -> {dot, u_var}
+    # animation_2: -{dot, u_var} -> {}
+    # animation_3 ~ animation_7: no change
+    SECTIONS = (1, 2)
+
+    def end_section(self, n):
+        # animation_2 needs dot and u_var from animation_1
+        if n != 1:
+            self.clean()
 
     def init(self):
         self.FADE_ANIMATION_OFF = True
 
         plane = Axes(**AX_CONFIG).shift(LEFT*2)
         labels = plane.get_axis_labels(x_label="x", y_label="y")
+        self.mark_static(plane, labels)
 
         # indifference curve
         ic = IndifferenceCurve(3)
-        ic_graph = ic.get_graph(plane)
+        ic_graph = IndifferenceCurveGraph(plane, ic)
         self.add(plane, labels, ic_graph)
 
         self.plane, self.ic, self.ic_graph = plane, ic, ic_graph
 
         # mobjects introduced in self.init, and to be kept in self.clean
-        self.protected_mobjects = set((plane, ic, ic_graph, labels))
-    
-    def clean(self):
-        for m in self.mobjects:
-            if m not in self.protected_mobjects:
-                self.remove(m)
-
-    def add_mobjects(self, *args, animation=FadeIn, **kwargs):
-        if self.FADE_ANIMATION_OFF and animation == FadeIn:
-            animation = None
-        if animation is None:
-            self.add(*args)
-        else:
-            self.play(animation(Group(*args)), **kwargs)
-
-    def remove_mobjects(self, *args, animation=FadeOut, **kwargs):
-        if self.FADE_ANIMATION_OFF and animation == FadeOut:
-            animation = None
-        if animation is not None:
-            self.play(animation(Group(*args)), **kwargs)
-        self.remove(*args)
+        self.protect(plane, ic_graph, labels)
 
-    
     def animation_1(self):
         # dot moving along a fixed indifference curve
         # mobjects change: +{dot, u_var} -> {dot, u_var}
         plane, ic, ic_graph = self.plane, self.ic, self.ic_graph
 
-        dot = Dot(ic_graph.get_start()).add_updater(
-            lambda d: d.move_to(ic.get_pos(plane, x=x_tracker.get_value()))
+        dot_coords = (ic.x_range[0], ic.f(ic.x_range[0]))
+        x_tracker = ValueTracker(dot_coords[0])
+        # dot position and Qy for every frame of each play
+        x_table = TrackerTable(
+            x_tracker, 
+            pos=lambda xs: coords_to_points(plane, xs, ic.f(xs)), 
+            qy=ic.f
         )
 
+        dot = Dot(ic_graph.get_start()).add_updater(dependent_updater(
+            lambda d: d.move_to(x_table.get("pos")), x_tracker
+        ))
+
         # Variables showing quantities of goods x and y, and utility
-        dot_coords = (ic.x_range[0], ic.f(ic.x_range[0]))
-        u_var = Variable(ic.u, 'U', num_decimal_places=3)
-        qx_var = Variable(dot_coords[0], "Q_x", num_decimal_places=3)
-        qy_var = Variable(dot_coords[1], 'Q_y', num_decimal_places=3)
+        u_var = Readout(ic.u, 'U', num_decimal_places=3)
+        qx_var = Readout(dot_coords[0], "Q_x", num_decimal_places=3)
+        qy_var = Readout(dot_coords[1], 'Q_y', num_decimal_places=3)
 
         Group(u_var, qx_var, qy_var).arrange(DOWN).shift(UR*2 + RIGHT*.5)
-        qx_var.add_updater(lambda v: v.tracker.set_value(x_tracker.get_value()))
-        qy_var.add_updater(lambda v: v.tracker.set_value(
-            ic.f(x_tracker.get_value())
-        ))
+        qx_var.add_updater(dependent_updater(lambda v: v.tracker.set_value(x_tracker.get_value()), x_tracker))
+        qy_var.add_updater(dependent_updater(lambda v: v.tracker.set_value(x_table.get("qy")), x_tracker))
 
         self.add(dot, u_var, qx_var, qy_var)
 
-        x_tracker = ValueTracker(dot_coords[0])
         x_values = (ic.x_range[1], ic.u)
         for x in x_values:
-            self.play(x_tracker.animate.set_value(x), run_time=2)
+            x_table.play(self, x, run_time=2)
         self.wait()
 
         # clean up
@@ -304,19 +231,20 @@ class IndifferenceCurveIntro(Scene):
         plane, ic, ic_graph = self.plane, self.ic, self.ic_graph
         dot, u_var = self.dot, self.u_var
 
-        dot.add_updater(
-            lambda d: d.move_to(plane.c2p(u_tracker.get_value(), u_tracker.get_value()))
-        )
+        u_tracker = ValueTracker(ic.u)
 
-        ic_graph.add_updater(
-            lambda l: l.become(IndifferenceCurve(u_tracker.get_value()).get_graph(plane))
-        )
+        dot.add_updater(dependent_updater(
+            lambda d: d.move_to(plane.c2p(u_tracker.get_value(), u_tracker.get_value())), u_tracker
+        ))
 
-        u_var.add_updater(
-            lambda v: v.tracker.set_value(u_tracker.get_value()**2)
-        )
+        ic_graph.add_updater(dependent_updater(
+            lambda l: l.set_params(u=u_tracker.get_value()), u_tracker
+        ))
+
+        u_var.add_updater(dependent_updater(
+            lambda v: v.tracker.set_value(u_tracker.get_value()**2), u_tracker
+        ))
         
-        u_tracker = ValueTracker(ic.u)
         u_values = [7, 1, 3]
         for u in u_values:
             self.play(u_tracker.animate.set_value(u), run_time=2)
@@ -386,51 +314,49 @@ class IndifferenceCurveIntro(Scene):
         
         # tracking x position of dot, starting from mid point of indifference curve
         x_tracker = ValueTracker(ic.u)
-
-        dot1 = Dot().add_updater(
-            lambda d: d.move_to(ic.get_pos(plane, x=x_tracker.get_value()))
-        )
-        dot2 = Dot().add_updater(
-            lambda d: d.move_to(ic.get_pos(plane, x=x_tracker.get_value() + 1))
+        # bundles at x and x + 1, and the corner (x + 1, f(x)) between them, for every frame
+        x_table = TrackerTable(
+            x_tracker, 
+            pos1=lambda xs: coords_to_points(plane, xs, ic.f(xs)), 
+            pos2=lambda xs: coords_to_points(plane, xs + 1, ic.f(xs + 1)), 
+            corner=lambda xs: coords_to_points(plane, xs + 1, ic.f(xs)), 
+            dqy=lambda xs: ic.f(xs) - ic.f(xs + 1)
         )
 
+        dot1 = Dot().add_updater(dependent_updater(lambda d: d.move_to(x_table.get("pos1")), x_tracker))
+        dot2 = Dot().add_updater(dependent_updater(lambda d: d.move_to(x_table.get("pos2")), x_tracker))
+
         # dashed line showing the Qx difference between bundle dot1 and dot2 doesn't change
-        line_x = DashedLine().add_updater(lambda l: l.put_start_and_end_on(
-            ic.get_pos(plane, x=x_tracker.get_value()), 
-            plane.c2p(x_tracker.get_value() + 1, ic.f(x_tracker.get_value()))
-        ))
+        line_x = DashedSegment().add_updater(dependent_updater(lambda l: l.put_start_and_end_on(
+            x_table.get("pos1"), x_table.get("corner")
+        ), x_tracker))
 
-        label_x = MathTex(r"\Delta Q_x=1").scale(.75).next_to(line_x, UP).add_updater(
-            lambda l: l.next_to(line_x, UP)
-        )
+        label_x = MathTex(r"\Delta Q_x=1").scale(.75).next_to(line_x, UP).add_updater(dependent_updater(
+            lambda l: l.next_to(line_x, UP), line_x
+        ))
 
         # line showing the Qy difference between bundle dot1 and dot2
-        line_y = DashedLine().set_color(YELLOW).add_updater(lambda l: l.put_start_and_end_on(
-            plane.c2p(x_tracker.get_value() + 1, ic.f(x_tracker.get_value())), 
-            ic.get_pos(plane, x=x_tracker.get_value() + 1)
-        ))
+        line_y = DashedSegment().set_color(YELLOW).add_updater(dependent_updater(lambda l: l.put_start_and_end_on(
+            x_table.get("corner"), x_table.get("pos2")
+        ), x_tracker))
 
         # variable showing delta Qy
         init_delta_qy = ic.f(ic.x_range[0]) - ic.f(ic.x_range[0] + 1)
-        label_y = Variable(init_delta_qy, r"\Delta Q_y")
+        label_y = Readout(init_delta_qy, r"\Delta Q_y")
         label_y.scale(.75).next_to(line_y, RIGHT)
 
         # updaters
-        label_y.add_updater(lambda l: l.next_to(line_y, RIGHT)) # follow `line_y`
-        label_y.add_updater(lambda v: v.tracker.set_value(
-            ic.f(x_tracker.get_value()) - ic.f(x_tracker.get_value() + 1)
-        ))
+        label_y.add_updater(dependent_updater(lambda l: l.next_to(line_y, RIGHT), line_y)) # follow `line_y`
+        label_y.add_updater(dependent_updater(lambda v: v.tracker.set_value(x_table.get("dqy")), x_tracker))
 
         # showing how much of good y would one like to trade for a unit of good x
         # dqy_var: "X=_Y"
-        dqy_var = Variable(init_delta_qy, r"X", num_decimal_places=3)
-        dqy_var.add_updater(lambda v: v.tracker.set_value(
-            ic.f(x_tracker.get_value()) - ic.f(x_tracker.get_value() + 1)
-        ))
+        dqy_var = Readout(init_delta_qy, r"X", num_decimal_places=3)
+        dqy_var.add_updater(dependent_updater(lambda v: v.tracker.set_value(x_table.get("dqy")), x_tracker))
         dqy_var.add(MathTex("Y").next_to(dqy_var, RIGHT))
         
-        qx_var = Variable(ic.f(ic.x_range[0]), "Q_x", num_decimal_places=3)
-        qx_var.add_updater(lambda v: v.tracker.set_value(x_tracker.get_value()))
+        qx_var = Readout(ic.f(ic.x_range[0]), "Q_x", num_decimal_places=3)
+        qx_var.add_updater(dependent_updater(lambda v: v.tracker.set_value(x_tracker.get_value()), x_tracker))
         Group(qx_var, dqy_var).arrange(DOWN).shift(UR*2 + RIGHT*.5)
         
         # arrows showing that as Qx increases, delta Qy decreases, and vice versa
@@ -452,7 +378,7 @@ class IndifferenceCurveIntro(Scene):
                     Rotate(dqy_arrow, angle=PI), 
                     Rotate(qx_arrow, angle=PI)
                 )
-            self.play(x_tracker.animate.set_value(x), run_time=1.5)
+            x_table.play(self, x, run_time=1.5)
         self.wait()
 
         self.remove_mobjects(
@@ -469,35 +395,39 @@ class IndifferenceCurveIntro(Scene):
         # tracking x position of dot, starting from mid point of indifference curve
         x_tracker = ValueTracker(ic.u)
 
-        DU = lambda x: -ic.u**2/x**2 # derivative of utility function
+        DU = ic.get_slope # derivative of utility function
 
-        def get_start_and_end_of_tangent_line(pos=None, du=None):
-            if pos is None:
-                pos = ic.get_coords(x=x_tracker.get_value())
-            if du is None: # derivative of utility function
-                du = DU
-
-            x0, y0 = pos
+        def get_start_and_end_of_tangent_lines(xs):
+            # (len(xs), 2, 3) array of start & end points of the tangent lines at xs
+            x0, y0 = xs, ic.f(xs)
             # y - y0 = k(x - x0)
             # => y = k*x - k*x0 + y0
             # => y = k*x + b
             # (b = -k*x0 + y0; y in [0, AX_HEIGHT])
-            k = du(pos[0])
+            k = DU(x0)
             b = -k*x0 + y0
-            f = lambda x: k*x +b # function of tanget line
 
             # start & end pos: (xl, yl), (xr, yr)
             # avoid zero division & keep within square with a=2, and center at (x0, y0)
-            xl = max(0.1, x0 - 1, (AX_HEIGHT - b)/k, (y0 + 1 - b)/k)
-            xr = min(AX_WIDTH, x0 + 1, -b/k, (y0 - 1 - b)/k)
-            return plane.c2p(xl, f(xl)), plane.c2p(xr, f(xr))
+            xl = np.maximum.reduce([np.full_like(x0, .1), x0 - 1, (AX_HEIGHT - b)/k, (y0 + 1 - b)/k])
+            xr = np.minimum.reduce([np.full_like(x0, AX_WIDTH), x0 + 1, -b/k, (y0 - 1 - b)/k])
+            return np.stack([
+                coords_to_points(plane, xl, k*xl + b), 
+                coords_to_points(plane, xr, k*xr + b)
+            ], axis=1)
+
+        # dot position, tangent line and MRS for every frame
+        x_table = TrackerTable(
+            x_tracker, 
+            pos=lambda xs: coords_to_points(plane, xs, ic.f(xs)), 
+            tangent=get_start_and_end_of_tangent_lines, 
+            mrs=DU
+        )
         
-        dot = Dot().add_updater(lambda d: d.move_to(
-            ic.get_pos(plane, x=x_tracker.get_value())
-        ))
-        line = Line().set_color(YELLOW).add_updater(lambda l: l.put_start_and_end_on(
-            *get_start_and_end_of_tangent_line()
-        ))
+        dot = Dot().add_updater(dependent_updater(lambda d: d.move_to(x_table.get("pos")), x_tracker))
+        line = Line().set_color(YELLOW).add_updater(dependent_updater(lambda l: l.put_start_and_end_on(
+            *x_table.get("tangent")
+        ), x_tracker))
 
         # showing how to derive MRS=dy/dx=MU_y/MU_x
         pre_mrs_formula = MathTex(r"MRS=").shift(UR*2)
@@ -510,10 +440,10 @@ class IndifferenceCurveIntro(Scene):
         [suf.next_to(pre_mrs_formula, RIGHT) for suf in mrs_formula_sufs]
 
         # Variable showing MRS
-        mrs_var = Variable(None, r"MRS=\frac{dy}{dx}=\frac{MU_x}{MU_y}")
-        mrs_var.shift(UR*2).add_updater(
-            lambda v: v.tracker.set_value(DU(x_tracker.get_value()))
-        )
+        mrs_var = Readout(None, r"MRS=\frac{dy}{dx}=\frac{MU_x}{MU_y}")
+        mrs_var.shift(UR*2).add_updater(dependent_updater(
+            lambda v: v.tracker.set_value(x_table.get("mrs")), x_tracker
+        ))
         mrs_var.update()
 
         # deriving formulas for MRS
@@ -537,7 +467,7 @@ class IndifferenceCurveIntro(Scene):
         # animation
         x_values = (ic.x_range[1] - 1, ic.x_range[0], ic.u)
         for x in x_values:
-            self.play(x_tracker.animate.set_value(x), run_time=2)
+            x_table.play(self, x, run_time=2)
         self.wait()
 
         self.remove_mobjects(dot, line, mrs_var)
@@ -564,25 +494,29 @@ class IndifferenceCurveIntro(Scene):
             *_ic_graphs
         )
 
-
-# (potentioal) Animation #7: showing MRS for each point on the indifference curve
+    def animation_7(self):
+        # Animation #7: indifference map, color showing utility (darker = higher utility)
+        # mobjects change: no change
+        plane, ic_graph = self.plane, self.ic_graph
+
+        U_MAX = 10
+        L = 30
+        H = 255
+        # 200 indifference curves, all extracted in one pass (see UtilityContours)
+        levels = np.linspace(0.1, U_MAX, 200)
+        colors = ["#" + f"{int(H - (H - L)/U_MAX**.5*u**.5):02x}"*3 for u in levels]
+        ic_map = UtilityContours(
+            plane, IndifferenceCurve.get_utility, levels, 
+            x_range=[0, AX_WIDTH], y_range=[0, AX_HEIGHT], colors=colors
+        )
+        self.add(ic_map)
+        self.bring_to_front(ic_graph)
 
 
-        # Animation #?: multiple indifference curves, color showing utility (darker = higher utility)
-        # U_MAX = 10
-        # for u in np.linspace(0.1, U_MAX, 200):
-        #     L = 30
-        #     H = 255
-        #     # hex_val = hex(int(L + (H - L)/U_MAX**.5*u**.5))[2:] # hex value for each r, g, and b
-        #     hex_val = hex(int(H - (H - L)/U_MAX**.5*u**.5))[2:] # hex value for each r, g, and b
-        #     if len(hex_val) == 1:
-        #         hex_val = "0" + hex_val
-        #     rgb_color = "#" + hex_val*3 # color in rgb hex
-        #     ic_graph = IndifferenceCurve(u).get_graph(plane, color=rgb_color)
-        #     self.add(ic_graph)
+# (potentioal) Animation #8: showing MRS for each point on the indifference curve
 
 
-class DerivingDemandCurve(Scene):
+class DerivingDemandCurve(FrameRangeScene):
     """
     Deriving Demand Curve
 
@@ -599,65 +533,54 @@ class DerivingDemandCurve(Scene):
         plane2 = NumberPlane(**AX_CONFIG).shift(RIGHT*3)
         labels2 = plane2.get_axis_labels(x_label="Q_x", y_label="P_x")
 
-        # add number planes
-        self.add(plane, labels)
-        self.add(plane2, labels2)
+        # add number planes (static background layer)
+        self.add(*self.mark_static(plane, labels))
+        self.add(*self.mark_static(plane2, labels2))
 
         # graphs on plane
         bc = BudgetConstraint(PX, PY, BUDGET)
 
         p_tracker = ValueTracker(PX)
         # self.p_tracker = p_tracker
-        bc_graphs = bc.get_all_graphs(plane)
-        bc_graphs.add_updater(
-            lambda l: l.become(BudgetConstraint(p_tracker.get_value(), PY, BUDGET).get_all_graphs(plane))
+
+        # budget line, indifference curve and optimal point for the current Px, updated in place
+        bc_graphs = BudgetConstraintGraphs(plane, bc)
+        bc_graphs.add_updater(dependent_updater(
+            lambda l: l.set_params(px=p_tracker.get_value()), p_tracker
+        ))
+
+        # demanded Qx and its (Q, P) point, for every frame of each play
+        # (models.BudgetConstraint works on arrays of prices)
+        p_table = TrackerTable(
+            p_tracker, 
+            qx=lambda pxs: BudgetConstraint(pxs, PY, BUDGET).tan_pos[0], 
+            demand=lambda pxs: coords_to_points(plane2, BudgetConstraint(pxs, PY, BUDGET).tan_pos[0], pxs)
         )
 
         # Variables displaying values of Px and Qx
-        p_var = Variable(bc.px, "P_x", num_decimal_places=3)
-        q_var = Variable(bc.tan_pos[0], 'Q_x', num_decimal_places=3)
+        p_var = Readout(bc.px, "P_x", num_decimal_places=3)
+        q_var = Readout(bc.tan_pos[0], 'Q_x', num_decimal_places=3)
 
         Group(p_var, q_var).arrange(DOWN).shift(LEFT + UP*2.5)
-        p_var.add_updater(lambda v: v.tracker.set_value(p_tracker.get_value()))
-        q_var.add_updater(lambda v: v.tracker.set_value(
-            BudgetConstraint(p_tracker.get_value(), PY, BUDGET).tan_pos[0]
-        ))
+        p_var.add_updater(dependent_updater(lambda v: v.tracker.set_value(p_tracker.get_value()), p_tracker))
+        q_var.add_updater(dependent_updater(lambda v: v.tracker.set_value(p_table.get("qx")), p_tracker))
 
         self.play(FadeIn(bc_graphs), FadeIn(p_var), FadeIn(q_var))
 
         # demand curve on the Q-P plane 
-        self.last_dot_pos = (bc.tan_pos[0], bc.px)
-        self.demand_curve = VGroup()
-        self.demand_curve.add(Line(
-            plane2.c2p(*self.last_dot_pos), plane2.c2p(*self.last_dot_pos)
-        ))
-
-        self.demand_curve.add(Line(plane2.c2p(*self.last_dot_pos), plane2.c2p(*self.last_dot_pos)))
+        demand_dot = Dot(point=p_table.get("demand")) # (Q, P)
+        demand_dot.add_updater(dependent_updater(lambda d: d.move_to(p_table.get("demand")), p_tracker))
 
-        def demand_dot(): # (Q, P)
-            px = p_tracker.get_value()
-            qx = BudgetConstraint(px, PY, BUDGET).tan_pos[0]
-            self.last_dot_pos = (qx, px)
-            return Dot(point=plane2.coords_to_point(qx, px))
+        # traced (Q, P) path; fixed cost per frame regardless of how long Px sweeps
+        demand_curve = TracedCurve(plane2.c2p(bc.tan_pos[0], bc.px), color=YELLOW_D)
+        demand_curve.add_updater(dependent_updater(lambda c: c.add_point(p_table.get("demand")), p_tracker))
 
-        def demand_curve():
-            last_line = self.demand_curve[-1]
-            # print(last_line.get_end(), self.last_dot_pos)
-            new_line = Line(last_line.get_end(), plane2.c2p(*self.last_dot_pos), color=YELLOW_D)
-            self.demand_curve.add(new_line)
-            return self.demand_curve
-
-        demand_dot = always_redraw(demand_dot)
-        demand_curve = always_redraw(demand_curve)
         self.add(demand_dot, demand_curve)
 
         # animation: BC and IC moves as Px moves
         px_values = (9, BUDGET/AX_WIDTH/2, PX)
         for px in px_values:
-            self.play(
-                p_tracker.animate.set_value(px), 
-                run_time=2
-            )
+            p_table.play(self, px, run_time=2)
 
         self.wait()
 
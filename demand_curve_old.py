@@ -3,6 +3,10 @@ Utility func: u = x^p + y
 """
 
 from manim import *
+from plotting import (
+    get_plot_step, get_inner_slice, coords_to_points, 
+    corners_to_bezier_points, get_graph_from_points
+)
 
 S_HEIGHT = 8
 S_WIDTH = 14
@@ -13,14 +17,41 @@ P = .82
 class IndifferenceCurve:
     # utility function: u = x^p + y
     # y = -x^p + u
-    def __init__(self, ax, u, p=P):
+
+    # reference curve u=0 (y = -x^p) sampled on a fixed grid, for each (p, plot step)
+    reference_coords = {}
+
+    def __init__(self, ax, u, p=P, use_family=True):
         self.p = p
         self.u = u
         
         self.f = lambda x: -x**p + u
         self.x_range = [0, min(u**(1/p), S_WIDTH)]
 
-        self.graph = ax.plot(self.f, x_range=self.x_range, use_smoothing=False, color=BLUE)
+        if use_family:
+            # analytic family mode: no per-sample calls of self.f
+            xs, ys = self.get_family_coords(get_plot_step(ax))
+            points = corners_to_bezier_points(coords_to_points(ax, xs, ys))
+            self.graph = get_graph_from_points(points, color=BLUE)
+        else:
+            self.graph = ax.plot(self.f, x_range=self.x_range, use_smoothing=False, color=BLUE)
+
+    def get_reference_coords(self, step):
+        key = (self.p, step)
+        if key not in self.reference_coords:
+            xs = np.arange(0, S_WIDTH, step)
+            self.reference_coords[key] = xs, -xs**self.p
+        return self.reference_coords[key]
+
+    def get_family_coords(self, step):
+        # every indifference curve is the reference curve y = -x^p moved up by u
+        # samples: both ends of x_range and the reference grid in between
+        ref_xs, ref_ys = self.get_reference_coords(step)
+        inner = get_inner_slice(ref_xs, self.x_range)
+        x_min, x_max = self.x_range
+        xs = np.concatenate(([x_min], ref_xs[inner], [x_max]))
+        ys = np.concatenate(([self.f(x_min)], ref_ys[inner] + self.u, [self.f(x_max)]))
+        return xs, ys
 
 
 class BudgetConstraint:
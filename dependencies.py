@@ -0,0 +1,37 @@
+"""
+Updaters that only run when their inputs changed
+
+an updater declares its inputs: ValueTrackers, or other mobjects with dependent
+updaters. trackers are compared by value, mobjects by how often their dependent
+updaters ran, so the inputs form a dependency graph from trackers to mobjects.
+when none of the inputs changed since the updater last ran (e.g. during wait()
+or a Rotate of an unrelated mobject), the updater is skipped
+
+    dot.add_updater(dependent_updater(lambda d: d.move_to(...), x_tracker))
+    label.add_updater(dependent_updater(lambda l: l.next_to(dot, UP), dot))
+"""
+
+
+def get_version(mobject):
+    # value of a tracker; number of updates of a mobject with dependent updaters
+    if hasattr(mobject, "get_value"):
+        return mobject.get_value()
+    return getattr(mobject, "update_version", 0)
+
+
+def dependent_updater(updater, *inputs):
+    # updater(mobject), run when the version of any of `inputs` changed
+    last_versions = [None]
+
+    def update(mobject):
+        versions = tuple(get_version(m) for m in inputs)
+        if versions == last_versions[0]:
+            return
+        updater(mobject)
+        last_versions[0] = versions
+        mobject.update_version = getattr(mobject, "update_version", 0) + 1
+
+    update.inputs = inputs
+    update.updater = updater
+    return update
+
@@ -0,0 +1,245 @@
+"""
+Post-process rendered movies: merge runs of identical frames, re-encode GIFs
+
+    python encode.py out/*.gif [--threshold 2] [--colors 64]
+
+wait() segments and plays that barely change the picture produce runs of
+(nearly) identical frames. in GIFs each run is written as one frame with a
+longer delay; MP4/WebM files are re-encoded with ffmpeg's mpdecimate filter
+and a variable frame rate, so held frames are not stored again (at MOVIE_CRF,
+below the CRF manim encodes with, so the second encoding adds no visible loss)
+
+frames are compared with the first frame of their run, so slow changes are
+not merged away; `threshold` is the largest per-channel difference (0-255)
+that still counts as identical
+
+GIFs are written with one palette for all frames (`colors` colors, one of
+them reserved for transparency; sampled from every frame, no dithering: flat
+colors compress best). each frame after the first only stores the rectangle
+that changed since the previous one, and pixels inside it that didn't change
+are transparent, so long runs of them compress to almost nothing. fewer colors
+give smaller files; per scene, see the `colors` field of out/manifest.json
+
+files are only replaced when the re-encoded file is smaller
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# GIF frame delays are stored in centiseconds
+GIF_DELAY_UNIT = 10
+
+# pixels sampled from all frames of a GIF to compute its palette
+PALETTE_SAMPLES = 1_000_000
+
+# constant quality of re-encoded movies (manim encodes with libx264/VP9 at CRF 23;
+# 18 is visually lossless for libx264)
+MOVIE_CRF = 18
+
+
+def is_same_frame(a, b, threshold=0):
+    if a.shape != b.shape:
+        return False
+    if threshold == 0:
+        return np.array_equal(a, b)
+    return np.abs(a.astype(np.int16) - b.astype(np.int16)).max() <= threshold
+
+
+def get_hold_runs(frames, threshold=0):
+    # [(index of the first frame, number of frames)] of runs of same frames
+    runs = []
+    reference = None
+    for i, frame in enumerate(frames):
+        if reference is not None and is_same_frame(reference, frame, threshold):
+            runs[-1][1] += 1
+        else:
+            reference = frame
+            runs.append([i, 1])
+    return [tuple(run) for run in runs]
+
+
+def get_gif_durations(runs, durations):
+    # delay of each run in ms, rounded at run boundaries so the total doesn't drift
+    ends = np.cumsum(durations)
+    starts = ends - durations
+    boundaries = [starts[first] for first, _ in runs] + [ends[-1]]
+    boundaries = np.round(np.array(boundaries)/GIF_DELAY_UNIT)*GIF_DELAY_UNIT
+    return [int(max(d, GIF_DELAY_UNIT)) for d in np.diff(boundaries)]
+
+
+def get_changed_bbox(a, b):
+    # (top, bottom, left, right) of pixels that differ between frames a and b, None if none
+    # (RGB frames or 2d arrays of palette indices)
+    changed = a != b
+    if changed.ndim == 3:
+        changed = changed.any(axis=-1)
+    rows, cols = np.flatnonzero(changed.any(axis=1)), np.flatnonzero(changed.any(axis=0))
+    if not len(rows):
+        return None
+    return rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+
+
+def get_palette(frames, colors=256):
+    # P-mode image holding one palette for all frames
+    from PIL import Image
+
+    height, width = frames[0].shape[:2]
+    step = max(1, int(np.ceil(np.sqrt(len(frames)*height*width/PALETTE_SAMPLES))))
+    samples = np.concatenate([frame[::step, ::step].reshape(-1, 3) for frame in frames])
+    return Image.fromarray(samples[np.newaxis]).quantize(colors, method=Image.Quantize.MEDIANCUT)
+
+
+def read_gif(path):
+    # (RGB frames, delays in ms, loop)
+    from PIL import Image, ImageSequence
+
+    with Image.open(path) as im:
+        loop = im.info.get("loop", 0)
+        frames, durations = [], []
+        for frame in ImageSequence.Iterator(im):
+            durations.append(frame.info.get("duration", 100))
+            frames.append(np.asarray(frame.convert("RGB")))
+    return frames, durations, loop
+
+
+def get_delta_frames(indices, transparent):
+    # frames of palette indices to write, and the mean changed area of the frames after the first
+    # in each frame, pixels inside the rectangle that changed since the frame before
+    # (as displayed) but equal to it are `transparent`; outside the rectangle the
+    # frame repeats the one written before, so Pillow crops it to (at most) the rectangle
+    canvas = indices[0].copy()
+    written = [indices[0]]
+    area = 0
+    for frame in indices[1:]:
+        delta = written[-1].copy()
+        bbox = get_changed_bbox(canvas, frame)
+        if bbox is not None:
+            top, bottom, left, right = bbox
+            region, shown = frame[top:bottom, left:right], canvas[top:bottom, left:right]
+            delta[top:bottom, left:right] = np.where(region == shown, transparent, region)
+            shown[...] = region
+            area += (bottom - top)*(right - left)/frame.size
+        written.append(delta)
+    return written, area/max(len(indices) - 1, 1)
+
+
+def encode_gif(path, colors=256, threshold=0, output=None):
+    # re-encode the GIF at `path` (held frames merged, shared palette, transparent
+    # unchanged pixels in changed rectangles); returns a report: frames, sizes,
+    # encode time and mean changed area
+    from PIL import Image
+
+    start = time.perf_counter()
+    size = os.path.getsize(path)
+    frames, durations, loop = read_gif(path)
+    runs = get_hold_runs(frames, threshold)
+    kept = [frames[first] for first, _ in runs]
+
+    # the last palette index is transparent
+    palette = get_palette(kept, colors - 1)
+    transparent = colors - 1
+    indices = [
+        np.asarray(Image.fromarray(frame).quantize(palette=palette, dither=Image.Dither.NONE))
+        for frame in kept
+    ]
+    written, area = get_delta_frames(indices, transparent)
+
+    images = []
+    for frame in written:
+        image = Image.fromarray(frame, "P")
+        image.putpalette(palette.getpalette()[:3*transparent] + [0, 0, 0])
+        images.append(image)
+    images[0].save(
+        output or path, save_all=True, append_images=images[1:],
+        duration=get_gif_durations(runs, durations), loop=loop, disposal=1,
+        transparency=transparent, optimize=False
+    )
+    return {
+        "frames": (len(frames), len(kept)),
+        "size": (size, os.path.getsize(output or path)),
+        "seconds": time.perf_counter() - start,
+        "changed_area": area,
+        "colors": colors,
+    }
+
+
+def format_report(path, report):
+    (frames, kept), (size, new_size) = report["frames"], report["size"]
+    return (
+        f"{path}: {frames} -> {kept} frames, {report['colors']} colors, "
+        f"{size/1e6:.2f} -> {new_size/1e6:.2f} MB ({new_size/size:.0%}), "
+        f"{report['changed_area']:.0%} of each frame changed, {report['seconds']:.1f}s"
+    )
+
+
+def dedupe_movie(path, threshold=0, output=None):
+    # re-encode without duplicate frames (variable frame rate)
+    # mpdecimate compares 8x8 blocks; hi/lo are sums of differences per block
+    # without `output`, `path` is replaced only if that makes it smaller
+    hi = max(64*threshold, 1)
+    if path.endswith(".webm"):
+        # constant quality needs a zero bitrate with VP9
+        codec = ["-c:v", "libvpx-vp9", "-crf", str(MOVIE_CRF), "-b:v", "0"]
+    else:
+        codec = ["-c:v", "libx264", "-crf", str(MOVIE_CRF), "-pix_fmt", "yuv420p"]
+    root, ext = os.path.splitext(path)
+    tmp = output or f"{root}.dedupe{ext}"
+    subprocess.check_call([
+        "ffmpeg", "-y", "-loglevel", "error", "-i", path,
+        "-vf", f"mpdecimate=hi={hi}:lo={hi}:frac=0", "-vsync", "vfr", *codec, tmp
+    ])
+    if output is None:
+        replace_if_smaller(path, tmp)
+
+
+def replace_if_smaller(path, tmp):
+    # keep the smaller of `path` and its re-encoding `tmp`; returns whether `path` was replaced
+    if os.path.getsize(tmp) < os.path.getsize(path):
+        os.replace(tmp, path)
+        return True
+    os.remove(tmp)
+    return False
+
+
+def optimize(path, colors=256, threshold=0):
+    # re-encode a rendered file in place, unless that makes it larger;
+    # formats other than gif/mp4/webm are left as they are
+    # returns a line for the log, None if nothing was done
+    root, ext = os.path.splitext(path)
+    tmp = f"{root}.encode{ext}"
+    if ext == ".gif":
+        report = format_report(path, encode_gif(path, colors, threshold, output=tmp))
+    elif ext in (".mp4", ".webm") and shutil.which("ffmpeg"):
+        start, size = time.perf_counter(), os.path.getsize(path)
+        dedupe_movie(path, threshold, output=tmp)
+        new_size = os.path.getsize(tmp)
+        report = f"{path}: {size/1e6:.2f} -> {new_size/1e6:.2f} MB ({new_size/size:.0%}), {time.perf_counter() - start:.1f}s"
+    else:
+        return None
+    if not replace_if_smaller(path, tmp):
+        report += ", original kept"
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--threshold", type=int, default=0)
+    parser.add_argument("--colors", type=int, default=256, help="GIF palette size (3-256, one of them transparent)")
+    args = parser.parse_args()
+
+    for path in args.paths:
+        report = optimize(path, args.colors, args.threshold)
+        if report is not None:
+            print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,11 @@
 from manim import *
-from demand_curve import IndifferenceCurve
+import models
+from curves import IndifferenceCurve
+from plotting import get_adaptive_graph, coords_to_points
+from sections import SectionedScene
+from timeline import TrackerTable
+from dependencies import dependent_updater
+from mobjects import DashedSegment
 
 AX_HEIGHT = 10
 AX_WIDTH = 10
@@ -23,34 +29,24 @@ AX_CONFIG = {
 }
 
 
-class UtilityOverWealth:
+class UtilityOverWealth(models.UtilityOverWealth):
     # utility function over wealth
+    # graphs of models.UtilityOverWealth on a given plane
     def __init__(self, plane):
-        self.P = .5
+        super().__init__(p=.5)
         self.plane = plane
-        self.f = lambda x: 2*x**self.P
 
     def get_graph(self, plane, **config):
-        return plane.plot(self.f, use_smoothing=False)
+        # adaptive samples: dense near w=0 where u(w) is steep, sparse on the flat tail
+        return get_adaptive_graph(plane, self.f, plane.x_range[:2])
 
-    def get_coords(self, x=None, y=None):
-        # return coordinates of a dot on the utility function
-        # given the x or y position of the dot
-        if x is not None and y is not None:
-            return (x, y)
-        if x is not None:
-            return (x, self.f(x))
-        if y is not None:
-            return (y**(1/self.P), y)
-        return None
-    
     def get_pos(self, x=None, y=None):
         # return position of a dot on the utility function relative to given plane
         # given the x or y position of the dot
         return self.plane.c2p(*self.get_coords(x, y))
 
 
-class UtilityIntro(Scene):
+class UtilityIntro(SectionedScene):
     """
     Utilty Introduction
 
@@ -61,32 +57,10 @@ class UtilityIntro(Scene):
     Animation #3: showing expected utility for bet: 50% +110; 50% -100
     Animation #4: showing expected utility for choices: 100% -750 or 75% -1000
     """
-    def construct(self):
-        self.init() # +{u_graph} -> {u_graph}
-        # self.animation_1() # no change
-        # self.animation_2() # no change
-        # self.animation_3() # no change
-        # self.animation_4() # no change
-
-    def clean(self):
-        for m in self.mobjects:
-            if m not in self.protected_mobjects:
-                self.remove(m)
-
-    def add_mobjects(self, *args, animation=FadeIn, **kwargs):
-        if self.FADE_ANIMATION_OFF and animation == FadeIn:
-            animation = None
-        if animation is None:
-            self.add(*args)
-        else:
-            self.play(animation(Group(*args)), **kwargs)
-
-    def remove_mobjects(self, *args, animation=FadeOut, **kwargs):
-        if self.FADE_ANIMATION_OFF and animation == FadeOut:
-            animation = None
-        if animation is not None:
-            self.play(animation(Group(*args)), **kwargs)
-        self.remove(*args)
+    # sections rendered after init (select others with `python sections.py ... --section N`)
+    # init: +{u_graph} -> {u_graph}
+    # animation_1 ~ animation_4: no change
+    SECTIONS = ()
 
     def init(self):
         self.FADE_ANIMATION_OFF = False
@@ -100,10 +74,10 @@ class UtilityIntro(Scene):
         u_graph = u_w.get_graph(plane)
 
         # Animation #0: showing u(w)
-        self.add(plane, labels)
+        self.add(*self.mark_static(plane, labels))
         self.add(u_graph)
         self.plane, self.u_w, self.u_graph = plane, u_w, u_graph
-        self.protected_mobjects = [self.plane, self.u_graph]
+        self.protect(plane, u_graph)
 
     def animation_1(self):
         # Animation #1: diminishing marginal utility of wealth
@@ -112,41 +86,40 @@ class UtilityIntro(Scene):
         p2c, c2p = plane.p2c, plane.c2p
 
         w_tracker = ValueTracker(0.1)
+        # points on u(w) and below them on the x axis at w and w + 1, and the corner 
+        # (w + 1, u(w)) between the points on u(w), for every frame of each play
+        w_table = TrackerTable(
+            w_tracker, 
+            pos0=lambda ws: coords_to_points(plane, ws, u_w.f(ws)), 
+            pos1=lambda ws: coords_to_points(plane, ws + 1, u_w.f(ws + 1)), 
+            axis0=lambda ws: coords_to_points(plane, ws, 0), 
+            axis1=lambda ws: coords_to_points(plane, ws + 1, 0), 
+            corner=lambda ws: coords_to_points(plane, ws + 1, u_w.f(ws))
+        )
 
-        def get_line_to_x_axis_pos(w):
-            # return start and end positions of a line from given point to the x axis
-            coords = u_w.get_coords(x=w)
-            return c2p(*coords), c2p(coords[0], 0)
-
-        def get_h_line_pos(w=None):
-            # retrun start and end positions of horizontal line 
-            # from end of brace (which marks marginal utility of next wealth unit)
-            # to start of to_x_axis_line_1
-            if w is None:
-                w = w_tracker.get_value()
-            return u_w.get_pos(x=w), c2p(w + 1, u_w.f(w))
-
-        to_x_axis_line_0 = DashedLine().add_updater(lambda l: l.put_start_and_end_on(
-            *get_line_to_x_axis_pos(w_tracker.get_value())
-        ))
-        to_x_axis_line_1 = DashedLine().add_updater(lambda l: l.put_start_and_end_on(
-            *get_line_to_x_axis_pos(w_tracker.get_value() + 1)
-        ))
+        # lines from the points on u(w) to the x axis
+        to_x_axis_line_0 = DashedSegment().add_updater(dependent_updater(lambda l: l.put_start_and_end_on(
+            w_table.get("pos0"), w_table.get("axis0")
+        ), w_tracker))
+        to_x_axis_line_1 = DashedSegment().add_updater(dependent_updater(lambda l: l.put_start_and_end_on(
+            w_table.get("pos1"), w_table.get("axis1")
+        ), w_tracker))
         to_x_axis_line_0.update()
         to_x_axis_line_1.update()
 
         # horizontal dashed line connnecting to_x_axis_line_1 tp brace (defined below)
-        h_line = DashedLine().add_updater(lambda l: l.put_start_and_end_on(
-            *get_h_line_pos()
-        ))
+        # from end of brace (which marks marginal utility of next wealth unit)
+        # to start of to_x_axis_line_1
+        h_line = DashedSegment().add_updater(dependent_updater(lambda l: l.put_start_and_end_on(
+            w_table.get("pos0"), w_table.get("corner")
+        ), w_tracker))
 
         # brace marking marginal utility of next wealth unit
-        brace_stem = Line().add_updater(lambda l: l.put_start_and_end_on(
-            c2p(w_tracker.get_value() + 1, u_w.f(w_tracker.get_value())), 
-            u_w.get_pos(x=w_tracker.get_value() + 1)
-        ))
-        brace_top = Line(ORIGIN, RIGHT/5).add_updater(lambda l: l.move_to(brace_stem, UP))
-        brace_bottom = Line(ORIGIN, RIGHT/5).add_updater(lambda l: l.move_to(brace_stem, DOWN))
+        brace_stem = Line().add_updater(dependent_updater(lambda l: l.put_start_and_end_on(
+            w_table.get("corner"), w_table.get("pos1")
+        ), w_tracker))
+        brace_top = Line(ORIGIN, RIGHT/5).add_updater(dependent_updater(lambda l: l.move_to(brace_stem, UP), brace_stem))
+        brace_bottom = Line(ORIGIN, RIGHT/5).add_updater(dependent_updater(lambda l: l.move_to(brace_stem, DOWN), brace_stem))
         brace = Group(brace_stem, brace_top, brace_bottom).set_color(YELLOW)
 
 
@@ -154,7 +127,7 @@ class UtilityIntro(Scene):
 
         w_values = [9, .1]
         for w in w_values:
-            self.play(w_tracker.animate.set_value(w), run_time=2)
+            w_table.play(self, w, run_time=2)
 
         self.remove_mobjects(w_tracker, to_x_axis_line_0, to_x_axis_line_1, h_line, brace)
         # self.clean()
@@ -309,16 +282,22 @@ class NeoClassicalEndowmentEffect(Scene):
 
 
 
-class ProspectTheoryUtility(Scene):
+class ProspectTheoryUtility(SectionedScene):
     """
     Utility function in prospect theory
     """
-    def construct(self):
+    # still image, init only
+    SECTIONS = ()
+
+    def init(self):
         plane = Axes(**AX_CONFIG).shift(LEFT*2)
         # wealth - reference point
         labels = plane.get_axis_labels(x_label=r"c-r", y_label="U")
 
-        u_graph = plane.plot(lambda x: x**.7 if x>=0 else -2*(-x)**.7)
+        # adaptive samples around the kink at x=0
+        u = lambda x: models.prospect_utility(x, alpha=.7, loss_aversion=2)
+        u_graph = get_adaptive_graph(plane, u, plane.x_range[:2])
+        # u_graph = plane.plot(lambda x: x**.7 if x>=0 else -2*(-x)**.7)
         # u_graph = plane.plot(lambda x: x)
         
         self.add(plane, labels)
@@ -0,0 +1,154 @@
+"""
+Render one long play() call in frame ranges, in parallel
+
+    python frame_parallel.py demand_curve.py DerivingDemandCurve --play 2 [--parts N] [-q h] [--section N]
+
+`--play` is manim's animation number (as in `manim -n`, shown in its log).
+with `--section`, the workers replay the sections before it (they don't load
+checkpoints, see sections.py), so plays are numbered from the start of the scene
+(not as in the log of a render that restored a checkpoint).
+each worker is a manim process rendering only that play (`-n play,play`, the
+plays before it are skipped, not rendered) and only its share of the play's frames;
+the partial movies are then concatenated with ffmpeg
+
+scenes must derive from FrameRangeScene. updaters are assumed to be functions of
+the tracker values, so a worker can start at any frame; mobjects with
+`path_dependent = True` (e.g. TracedCurve) make workers run all updaters of the
+frames before their range (without rendering them)
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+from manim import *
+from tqdm import tqdm
+
+import tex_cache
+from profiler import ProfiledScene
+from static_layer import StaticLayerScene
+
+# "i/n": render the i-th of n frame ranges of the play that is not skipped
+FRAME_PART_ENV = "RENDER_FRAME_PART"
+SECTIONS_ENV = "RENDER_SECTIONS" # same as sections.SECTIONS_ENV
+
+PARTS_DIR = os.path.join("media", "frame_parts")
+
+
+def get_frame_part():
+    value = os.environ.get(FRAME_PART_ENV)
+    if not value:
+        return None
+    i, n = value.split("/")
+    return int(i), int(n)
+
+
+class FrameRangeScene(StaticLayerScene, ProfiledScene):
+    # scene whose plays can be rendered in frame ranges (see module docstring)
+    def has_path_dependent_mobjects(self):
+        return any(
+            getattr(m, "path_dependent", False)
+            for mob in self.mobjects for m in mob.get_family()
+        )
+
+    def _get_animation_time_progression(self, animations, duration):
+        # play_internal closes the progression, so it must be a progress bar
+        description = f"Animation {self.renderer.num_plays}"
+        replay = self.has_path_dependent_mobjects()
+        if self.renderer.skip_animations:
+            if replay:
+                # skipped plays jump to their end by default;
+                # path dependent mobjects need the updates of every frame
+                return self.get_time_progression(duration, description, override_skip_animations=True)
+            return super()._get_animation_time_progression(animations, duration)
+
+        frame_part = get_frame_part()
+        if frame_part is None:
+            return super()._get_animation_time_progression(animations, duration)
+
+        times = np.arange(0, duration, 1/config.frame_rate)
+        i, n = frame_part
+        start, end = len(times)*i//n, len(times)*(i + 1)//n
+        if replay:
+            for t in times[:start]:
+                self.update_to_time(t)
+        return tqdm(
+            times[start:end], desc=f"{description} (part {i + 1}/{n})",
+            leave=config.progress_bar == "leave", disable=config.progress_bar == "none"
+        )
+
+    def play_internal(self, skip_rendering=False):
+        # frames of skipped plays that are replayed are updated, not rasterized
+        super().play_internal(skip_rendering=skip_rendering or self.renderer.skip_animations)
+
+
+def render_part(path, scene, play, i, n, quality, section=None):
+    env = dict(os.environ)
+    env[FRAME_PART_ENV] = f"{i}/{n}"
+    if section is not None:
+        env[SECTIONS_ENV] = str(section)
+    media_dir = os.path.join(PARTS_DIR, f"{scene}-{play}", str(i))
+    os.makedirs(media_dir, exist_ok=True)
+    tex_cache.restore(media_dir)
+    command = [
+        sys.executable, "-m", "manim", "render", "-q", quality, "--format", "mp4",
+        "-n", f"{play},{play}", "--media_dir", media_dir, "-o", f"part_{i}", path, scene
+    ]
+    log = open(os.path.join(media_dir, "render.log"), "w")
+    return subprocess.Popen(command, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+
+def concat_movies(paths, output):
+    # stream copy: all parts are encoded with the same settings
+    list_path = output + ".txt"
+    with open(list_path, "w") as f:
+        f.writelines(f"file '{os.path.abspath(path)}'\n" for path in paths)
+    subprocess.check_call([
+        "ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+        "-i", list_path, "-c", "copy", output
+    ])
+    os.remove(list_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path")
+    parser.add_argument("scene")
+    parser.add_argument("--play", type=int, required=True, help="animation number, as in manim -n")
+    parser.add_argument("--parts", type=int, default=os.cpu_count())
+    parser.add_argument("-q", "--quality", default="h", choices=list("lmhpk"))
+    parser.add_argument("--section", type=int, help="for SectionedScene: section to run")
+    args = parser.parse_args()
+
+    if shutil.which("ffmpeg") is None:
+        print("ffmpeg is needed to concatenate the parts")
+        return 1
+
+    start = time.perf_counter()
+    workers = [
+        render_part(args.path, args.scene, args.play, i, args.parts, args.quality, args.section)
+        for i in range(args.parts)
+    ]
+    returncodes = [worker.wait() for worker in workers]
+    for i in range(args.parts):
+        tex_cache.publish(os.path.join(PARTS_DIR, f"{args.scene}-{args.play}", str(i)))
+    if any(returncodes):
+        print(f"some parts failed, see {os.path.join(PARTS_DIR, f'{args.scene}-{args.play}', '*', 'render.log')}")
+        return 1
+
+    parts = []
+    for i in range(args.parts):
+        pattern = os.path.join(PARTS_DIR, f"{args.scene}-{args.play}", str(i), "videos", "**", f"part_{i}.mp4")
+        parts += [path for path in glob.glob(pattern, recursive=True) if "partial_movie_files" not in path]
+    output = os.path.join(PARTS_DIR, f"{args.scene}-{args.play}.mp4")
+    concat_movies(parts, output)
+    print(f"{output} ({args.parts} parts, {time.perf_counter() - start:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""
+Incremental rebuild of the gallery in out/
+
+    python manifest.py status              # artifacts whose inputs changed
+    python manifest.py build [-q m] [--jobs N] [--force]
+    python manifest.py pages               # regenerate the gallery pages
+    python manifest.py adopt [-q m] [--manim VERSION]  # files in out/ are up to date
+
+out/manifest.json lists every artifact of the gallery (scene section, formats,
+gallery page and caption, optionally the GIF palette size `colors`) with a
+hash of everything its render depends on:
+the source of the scene class (without the sections after it), the module-level
+constants, classes and functions it reads (AX_CONFIG, PX, BUDGET, ...), the local
+modules it imports (curves, models, ...; not the render tooling, TOOL_MODULES)
+and the render settings. `build` re-renders only artifacts whose hash changed,
+then regenerates the gallery pages (out/*.md) from the manifest. `adopt`
+records the hashes of the files already in out/ without rendering them (e.g.
+rendered by hand, with the given manim version)
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+from importlib import metadata
+
+from render_gallery import DEFAULT_COLORS, RenderJob, run_jobs
+from scene_index import SECTION_PATTERN
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR = os.path.join(ROOT, "out")
+MANIFEST_PATH = os.path.join(OUT_DIR, "manifest.json")
+
+# modules scenes import that don't change what they draw (encoding, caching,
+# profiling, the manifest itself): left out of the hashes
+TOOL_MODULES = {"encode", "manifest", "profiler", "render_gallery", "scene_index", "tex_cache"}
+
+
+def read_source(path):
+    with open(os.path.join(ROOT, path)) as f:
+        return f.read()
+
+
+def get_local_module_files(name):
+    # files of a module (or package) of this repo, None for other modules
+    name = name.split(".")[0]
+    if os.path.exists(os.path.join(ROOT, name + ".py")):
+        return [name + ".py"]
+    package = os.path.join(ROOT, name)
+    if os.path.exists(os.path.join(package, "__init__.py")):
+        return sorted(os.path.join(name, f) for f in os.listdir(package) if f.endswith(".py"))
+    return None
+
+
+def get_module_dependencies(name, files=None):
+    # files of local module `name` and of the local modules it imports, recursively
+    # (not TOOL_MODULES)
+    files = set() if files is None else files
+    if name.split(".")[0] in TOOL_MODULES:
+        return files
+    for path in get_local_module_files(name) or ():
+        if path in files:
+            continue
+        files.add(path)
+        for node in ast.walk(ast.parse(read_source(path))):
+            if isinstance(node, ast.Import):
+                imported = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0:
+                imported = [node.module]
+            else:
+                continue
+            for module in imported:
+                get_module_dependencies(module, files)
+    return files
+
+
+def get_loaded_names(nodes):
+    names = set()
+    for node in nodes:
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load):
+                names.add(child.id)
+    return names
+
+
+def get_section_number(node):
+    match = isinstance(node, ast.FunctionDef) and SECTION_PATTERN.match(node.name)
+    return int(match.group(1)) if match else None
+
+
+def get_render_inputs(module, scene, section=None):
+    # {label: source} of everything rendering `section` of `scene` depends on
+    source = read_source(module)
+    tree = ast.parse(source)
+
+    # top-level definitions: name -> nodes (constants may be assigned more than once)
+    definitions = {}
+    imported_from = {}
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            definitions.setdefault(node.name, []).append(node)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                for name in (n.id for n in ast.walk(target) if isinstance(n, ast.Name)):
+                    definitions.setdefault(name, []).append(node)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            for alias in node.names:
+                imported_from[alias.asname or alias.name] = node.module
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                imported_from[alias.asname or alias.name.split(".")[0]] = alias.name
+
+    # the scene class, without sections after `section` (they can't change its state)
+    scene_node = definitions[scene][-1]
+    body = [
+        item for item in scene_node.body
+        if section is None or (get_section_number(item) or 0) <= section
+    ]
+    inputs = {f"{module}:{scene}": "\n".join(
+        [f"class {scene}({', '.join(ast.unparse(base) for base in scene_node.bases)}):"] +
+        [ast.get_source_segment(source, item) for item in body]
+    )}
+
+    # module-level names it reads, recursively
+    pending = get_loaded_names(body + scene_node.bases + scene_node.decorator_list)
+    seen = {scene}
+    files = set()
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        if name in definitions:
+            nodes = definitions[name]
+            inputs[f"{module}:{name}"] = "\n".join(ast.get_source_segment(source, node) for node in nodes)
+            pending |= get_loaded_names(nodes)
+        elif name in imported_from:
+            get_module_dependencies(imported_from[name], files)
+    # star imports of local modules
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and any(alias.name == "*" for alias in node.names):
+            get_module_dependencies(node.module, files)
+
+    for path in sorted(files):
+        inputs[path] = read_source(path)
+    return inputs
+
+
+def get_manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def get_artifact_hash(artifact, file_format, quality, manim_version=None):
+    inputs = get_render_inputs(artifact["module"], artifact["scene"], artifact["section"])
+    settings = {
+        "quality": quality, "format": file_format, "manim": manim_version or get_manim_version(), 
+        "colors": artifact.get("colors", DEFAULT_COLORS)
+    }
+    digest = hashlib.sha256(json.dumps(settings, sort_keys=True).encode())
+    for label in sorted(inputs):
+        digest.update(label.encode() + b"\0" + inputs[label].encode() + b"\0")
+    return digest.hexdigest()
+
+
+def load_manifest():
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+def save_manifest(manifest):
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+
+def get_stale(manifest, quality, force=False):
+    # [(artifact, format, new hash, reason)] of artifacts to re-render
+    stale = []
+    for artifact in manifest["artifacts"]:
+        for file_format in artifact["formats"]:
+            new_hash = get_artifact_hash(artifact, file_format, quality)
+            path = os.path.join(OUT_DIR, f"{artifact['name']}.{file_format}")
+            if force:
+                reason = "forced"
+            elif not os.path.exists(path):
+                reason = "missing"
+            elif artifact["hashes"].get(file_format) != new_hash:
+                reason = "changed"
+            else:
+                continue
+            stale.append((artifact, file_format, new_hash, reason))
+    return stale
+
+
+def adopt(manifest, quality, manim_version=None):
+    # [(artifact, format)] of the files in out/ whose hashes were recorded as up to date
+    adopted = []
+    for artifact in manifest["artifacts"]:
+        for file_format in artifact["formats"]:
+            if os.path.exists(os.path.join(OUT_DIR, f"{artifact['name']}.{file_format}")):
+                artifact["hashes"][file_format] = get_artifact_hash(artifact, file_format, quality, manim_version)
+                adopted.append((artifact, file_format))
+    manifest["settings"] = {"quality": quality, "manim": manim_version or get_manim_version()}
+    return adopted
+
+
+def write_pages(manifest):
+    # gallery pages, artifacts grouped by heading in manifest order
+    pages = {}
+    for artifact in manifest["artifacts"]:
+        pages.setdefault(artifact["page"], []).append(artifact)
+
+    for page, artifacts in pages.items():
+        lines = []
+        heading = None
+        for artifact in artifacts:
+            if artifact["heading"] != heading:
+                heading = artifact["heading"]
+                lines += [f"## {heading}", ""]
+            file_name = f"{artifact['name']}.{artifact['formats'][0]}"
+            lines += [artifact["caption"], "", f"![{artifact['name']}]({file_name})", ""]
+        with open(os.path.join(OUT_DIR, page), "w") as f:
+            f.write("\n".join(lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["status", "build", "pages", "adopt"])
+    parser.add_argument("-q", "--quality", default="m", choices=list("lmhpk"))
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="re-render everything")
+    parser.add_argument("--manim", help="adopt: manim version the files were rendered with (default: the installed one)")
+    args = parser.parse_args()
+
+    manifest = load_manifest()
+    if args.command == "pages":
+        write_pages(manifest)
+        return 0
+    if args.command == "adopt":
+        for artifact, file_format in adopt(manifest, args.quality, args.manim):
+            print(f"{'adopted':<10}{artifact['name']}.{file_format}")
+        save_manifest(manifest)
+        return 0
+
+    stale = get_stale(manifest, args.quality, args.force)
+    for artifact, file_format, _, reason in stale:
+        print(f"{reason:<10}{artifact['name']}.{file_format}")
+    if args.command == "status":
+        if not stale:
+            print("up to date")
+        return 0
+
+    jobs = [
+        RenderJob(
+            artifact["module"], artifact["scene"], artifact["section"], file_format,
+            artifact.get("colors", DEFAULT_COLORS)
+        )
+        for artifact, file_format, _, _ in stale
+    ]
+    if jobs:
+        run_jobs(jobs, args.quality, args.jobs, OUT_DIR)
+    for (artifact, file_format, new_hash, _), job in zip(stale, jobs):
+        if job.returncode == 0 and job.output:
+            artifact["hashes"][file_format] = new_hash
+    manifest["settings"] = {"quality": args.quality, "manim": get_manim_version()}
+    save_manifest(manifest)
+    write_pages(manifest)
+    return 0 if all(job.returncode == 0 for job in jobs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
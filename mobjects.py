@@ -0,0 +1,361 @@
+"""
+Mobjects shared by the scenes
+"""
+
+from manim import *
+
+from curves import IndifferenceCurve, BudgetConstraint
+from plotting import coords_to_points, get_contour_segments, get_plane_transform, segments_to_bezier_points
+
+
+class TracedCurve(VMobject):
+    # path traced by a moving point, drawn as a single VMobject
+    # e.g. the demand curve traced on the Q-P plane as Px changes
+    #
+    # bezier points are kept in a preallocated buffer (doubled when full),
+    # so adding a point is amortized O(1) and the existing path is never rebuilt;
+    # points closer than `min_distance` (default: one pixel) to the last one are dropped
+    #
+    # `points` is a view of the buffer: assigning points (set_points, become,
+    # clear_points, reverse_points, transforms...) copies them into the buffer,
+    # and later points are added after them
+
+    # depends on all earlier frames, not only the current tracker values (see frame_parallel)
+    path_dependent = True
+
+    def __init__(self, start_point, capacity=256, min_distance=None, **kwargs):
+        super().__init__(**kwargs)
+        if min_distance is None:
+            min_distance = config.frame_width/config.pixel_width
+        self.min_distance = min_distance
+
+        self.buffer = np.zeros((capacity*self.n_points_per_cubic_curve, 3))
+        self.n_points = 0
+        self.last_point = np.array(start_point, dtype=float)
+
+    @property
+    def points(self):
+        # no copy
+        return self.buffer[:self.n_points]
+
+    @points.setter
+    def points(self, points):
+        # also called by VMobject.__init__, before there is a buffer
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        if len(points):
+            # (before points that are a view of the buffer, e.g. reversed, are overwritten)
+            self.last_point = points[-1].copy()
+        buffer = getattr(self, "buffer", None)
+        if buffer is None or len(points) > len(buffer):
+            buffer = np.zeros((len(points) if buffer is None else max(len(points), 2*len(buffer)), 3))
+        # numpy copies points that overlap the buffer first
+        buffer[:len(points)] = points
+        self.buffer = buffer
+        self.n_points = len(points)
+
+    def add_point(self, point):
+        point = np.array(point, dtype=float)
+        if np.linalg.norm(point - self.last_point) < self.min_distance:
+            return self
+
+        nppcc = self.n_points_per_cubic_curve
+        start = self.n_points
+        if start + nppcc > len(self.buffer):
+            self.buffer = np.concatenate([self.buffer, np.zeros_like(self.buffer)])
+
+        # straight segment from the last point to the new one
+        alphas = np.linspace(0, 1, nppcc).reshape(-1, 1)
+        self.buffer[start:start + nppcc] = interpolate(self.last_point, point, alphas)
+        self.n_points += nppcc
+        self.last_point = point
+        return self
+
+
+class ModelGraph(VMobject):
+    # graph of a model of curves.py, bound to it: set_params(px=...) makes a new
+    # model with the changed parameters and rewrites the points of the graph in place
+    # (l.become(model.get_graph(plane)) builds a new graph every frame and copies it);
+    # the number of curves is fixed, so the point array is allocated once.
+    # the graph makes the only model of a frame: the other updaters of the tracker
+    # read its TrackerTable (timeline.py) instead of sharing that model
+    # the plane must not move after the graph is made
+    #
+    # subclasses define get_bezier_coords(model): (xs, ys), the plane coordinates
+    # of the n_curves*4 bezier points of the graph of `model`, or override set_model
+
+    model_class = None
+    # parameters of model_class.__init__, read from the model by set_params
+    param_names = ()
+    n_curves = 1
+
+    def __init__(self, plane, model, **kwargs):
+        super().__init__(**kwargs)
+        self.origin, self.unit_x, self.unit_y = get_plane_transform(plane)
+        self.points = np.zeros((self.n_curves*self.n_points_per_cubic_curve, 3))
+        self.set_model(model)
+
+    def set_model(self, model):
+        self.model = model
+        xs, ys = self.get_bezier_coords(model)
+        np.multiply.outer(xs, self.unit_x, out=self.points)
+        self.points += np.multiply.outer(ys, self.unit_y)
+        self.points += self.origin
+        return self
+
+    def get_model(self, **params):
+        # model with the parameters of the current one, except `params`
+        params = {**{name: getattr(self.model, name) for name in self.param_names}, **params}
+        return self.model_class(**params)
+
+    def set_params(self, **params):
+        return self.set_model(self.get_model(**params))
+
+
+class BudgetConstraintGraph(ModelGraph):
+    # the budget line as one straight curve
+    model_class = BudgetConstraint
+    param_names = ("px", "py", "budget")
+
+    def get_bezier_coords(self, bc):
+        alphas = np.linspace(0, 1, self.n_points_per_cubic_curve)
+        xs = interpolate(*bc.x_range, alphas)
+        return xs, bc.f(xs)
+
+
+class IndifferenceCurveGraph(ModelGraph):
+    # the points of IndifferenceCurve.get_graph (cached, scaled from the reference
+    # curve, sampled to the pixel tolerance, see curves.py), copied into the
+    # graph's point array; the array is only reallocated when the number of
+    # samples changes
+    model_class = IndifferenceCurve
+    param_names = ("u", "use_family", "x_max", "y_max")
+
+    def __init__(self, plane, model, **kwargs):
+        self.plane = plane
+        super().__init__(plane, model, **kwargs)
+
+    def set_model(self, model):
+        self.model = model
+        points = model.get_graph_points(self.plane)
+        if len(points) == len(self.points):
+            self.points[:] = points
+        else:
+            self.points = np.array(points)
+        return self
+
+
+class BudgetConstraintGraphs(VGroup):
+    # budget line, highest indifference curve (blue) and optimal point of a budget
+    # constraint, like BudgetConstraint.get_all_graphs, all updated in place by set_params
+    def __init__(self, plane, bc, **kwargs):
+        self.bc_graph = BudgetConstraintGraph(plane, bc)
+        self.ic_graph = IndifferenceCurveGraph(plane, bc.ic, color=BLUE)
+        self.optimal_point_dot = Dot()
+        super().__init__(self.bc_graph, self.ic_graph, self.optimal_point_dot, **kwargs)
+        self.set_model(bc)
+
+    def set_model(self, bc):
+        self.bc_graph.set_model(bc)
+        self.ic_graph.set_model(bc.ic)
+        origin, unit_x, unit_y = self.bc_graph.origin, self.bc_graph.unit_x, self.bc_graph.unit_y
+        self.optimal_point_dot.move_to(origin + bc.tan_pos[0]*unit_x + bc.tan_pos[1]*unit_y)
+        return self
+
+    def set_params(self, **params):
+        return self.set_model(self.bc_graph.get_model(**params))
+
+
+class DashedSegment(VMobject):
+    # dashed straight line repositioned every frame, e.g. guides from a dot to the axes
+    #
+    # all dashes are curves of one VMobject, at fixed fractions of the segment
+    # (DashedLine: one submobject per dash, each moved by put_start_and_end_on);
+    # put_start_and_end_on fills the preallocated points in place,
+    # start + fraction*(end - start), so the dash pattern is never rebuilt.
+    # like DashedLine, the number of dashes is set by the initial length
+
+    def __init__(
+        self, start=LEFT, end=RIGHT, dash_length=DEFAULT_DASH_LENGTH, dashed_ratio=.5, 
+        num_dashes=None, **kwargs
+    ):
+        super().__init__(**kwargs)
+        start, end = np.array(start, dtype=float), np.array(end, dtype=float)
+        if num_dashes is None:
+            num_dashes = max(int(np.ceil(np.linalg.norm(end - start)/dash_length*dashed_ratio)), 1)
+
+        # period of the pattern (dash + gap) such that the first dash starts at 0 and the last ends at 1
+        period = 1/(num_dashes - 1 + dashed_ratio)
+        dash_starts = np.arange(num_dashes)*period
+        alphas = np.linspace(0, 1, self.n_points_per_cubic_curve)
+        # fraction of the segment at each bezier point (control points at thirds of each dash)
+        self.fractions = (dash_starts[:, np.newaxis] + alphas*dashed_ratio*period).reshape(-1, 1)
+        self.points = np.zeros((len(self.fractions), 3))
+        self.put_start_and_end_on(start, end)
+
+    def put_start_and_end_on(self, start, end):
+        start = np.asarray(start, dtype=float)
+        np.multiply(self.fractions, np.asarray(end, dtype=float) - start, out=self.points)
+        self.points += start
+        return self
+
+
+class UtilityContours(VGroup):
+    # iso-utility curves of utility(x, y) for many levels at once
+    # utility is evaluated on a grid in one vectorized call, all levels are
+    # extracted in one batch, and levels of the same color share one VMobject
+    #
+    # utility: vectorized function of x and y arrays
+    # colors: one color per level (default: all in `color`)
+    def __init__(
+        self, plane, utility, levels, x_range, y_range, 
+        resolution=300, colors=None, color=WHITE, **kwargs
+    ):
+        super().__init__()
+        xs = np.linspace(*x_range, resolution)
+        ys = np.linspace(*y_range, resolution)
+        values = utility(*np.meshgrid(xs, ys))
+
+        level_i, starts, ends = get_contour_segments(xs, ys, values, levels)
+        if colors is None:
+            colors = [color]*len(levels)
+
+        # group segments by color
+        colors = np.array([str(c) for c in colors])
+        for c in np.unique(colors):
+            seg_i = np.nonzero(colors[level_i] == c)[0]
+            if len(seg_i) == 0:
+                continue
+            curve = VMobject(color=c, **kwargs)
+            curve.points = segments_to_bezier_points(
+                coords_to_points(plane, *starts[seg_i].T), 
+                coords_to_points(plane, *ends[seg_i].T)
+            )
+            self.add(curve)
+
+
+class UtilityHeatMap(ImageMobject):
+    # raster layer coloring each pixel of the plane region by utility(x, y)
+    # color goes from low_color (utility 0) to high_color (u_max) along u^gamma;
+    # `n_bands` > 0 quantizes utility into bands, which look like contours
+    def __init__(
+        self, plane, utility, u_max, x_range, y_range, resolution=400, 
+        low_color=WHITE, high_color=BLACK, gamma=.5, n_bands=0, **kwargs
+    ):
+        xs = np.linspace(*x_range, resolution)
+        ys = np.linspace(*y_range, resolution)[::-1] # image rows go top to bottom
+        values = np.clip(utility(*np.meshgrid(xs, ys))/u_max, 0, 1)**gamma
+        if n_bands > 0:
+            values = np.floor(values*n_bands)/n_bands
+
+        low = np.array(color_to_rgb(low_color))
+        high = np.array(color_to_rgb(high_color))
+        rgb = low*(1 - values[..., None]) + high*values[..., None]
+        rgba = np.concatenate((rgb, np.ones_like(values)[..., None]), axis=-1)
+        super().__init__((rgba*255).astype(np.uint8), **kwargs)
+
+        # cover the plane region
+        corner_0 = plane.c2p(x_range[0], y_range[0])
+        corner_1 = plane.c2p(x_range[1], y_range[1])
+        self.stretch_to_fit_width(corner_1[0] - corner_0[0])
+        self.stretch_to_fit_height(corner_1[1] - corner_0[1])
+        self.move_to((corner_0 + corner_1)/2)
+
+
+class GlyphNumber(VMobject):
+    # number typeset from cached glyphs: each character (digit, sign, point, comma)
+    # is typeset once per process; set_value only moves copies of them into place
+    # (DecimalNumber typesets and arranges a new number on every set_value)
+    #
+    # two invisible points, at the baseline and at digit height above it,
+    # follow moves and scaling of the number and give its current position and scale
+
+    # character -> MathTex
+    glyphs = {}
+
+    def __init__(self, number=0, num_decimal_places=2, group_with_commas=True, **kwargs):
+        super().__init__(**kwargs)
+        self.num_decimal_places = num_decimal_places
+        self.group_with_commas = group_with_commas
+        self.digit_buff = DecimalNumber.digit_buff_per_font_unit*DEFAULT_FONT_SIZE
+        self.digit_height = self.get_glyph("0").height
+
+        self.baseline = VectorizedPoint(ORIGIN)
+        self.top = VectorizedPoint(UP*self.digit_height)
+        # glyph copies not currently shown, by character
+        self.pool = {}
+        self.string = None
+        self.number = None
+        self.set_value(0 if number is None else number)
+
+    @classmethod
+    def get_glyph(cls, char):
+        if char not in cls.glyphs:
+            cls.glyphs[char] = MathTex(char)
+        return cls.glyphs[char]
+
+    def get_string(self, number):
+        comma = "," if self.group_with_commas else ""
+        string = f"{number:{comma}.{self.num_decimal_places}f}"
+        # no "-0.000"
+        return string[1:] if string.startswith("-") and not float(string[1:].replace(",", "")) else string
+
+    def take_glyph(self, char, scale, style=None):
+        # copy of the glyph of `char` at the given scale, from the pool if possible,
+        # with the style of the glyph `style` (the number may have been recolored
+        # or faded since pooled glyphs were last shown)
+        pool = self.pool.get(char)
+        glyph = pool.pop() if pool else self.get_glyph(char).copy()
+        if style is not None and glyph is not style:
+            glyph.match_style(style)
+        template = self.get_glyph(char)
+        if template.width > 0 and abs(glyph.width/template.width - scale) > 1e-6*scale:
+            glyph.scale(scale*template.width/glyph.width)
+        return glyph
+
+    def set_value(self, number):
+        self.number = number
+        string = self.get_string(number)
+        if string == self.string:
+            return self
+
+        origin = self.baseline.get_center()
+        scale = np.linalg.norm(self.top.get_center() - origin)/self.digit_height
+        shown = [m for m in self.submobjects if m not in (self.baseline, self.top)]
+        for glyph, char in zip(shown, self.string or ""):
+            self.pool.setdefault(char, []).append(glyph)
+
+        glyphs = []
+        x = origin[0]
+        style = shown[0] if shown else None
+        for char in string:
+            glyph = self.take_glyph(char, scale, style)
+            if char == "-":
+                # minus sign centered on the digits
+                glyph.move_to([x, origin[1] + self.digit_height*scale/2, 0], aligned_edge=LEFT)
+            else:
+                glyph.move_to([x, origin[1], 0], aligned_edge=DL)
+            x += glyph.width + self.digit_buff*scale
+            glyphs.append(glyph)
+
+        self.submobjects = [self.baseline, self.top, *glyphs]
+        self.string = string
+        return self
+
+    def get_value(self):
+        return self.number
+
+
+class Readout(VMobject):
+    # "<label> = <number>" like manim's Variable (same `tracker`, `label` and
+    # `value` attributes), with the number drawn from cached glyphs (GlyphNumber)
+    def __init__(self, var, label, num_decimal_places=2, **kwargs):
+        super().__init__(**kwargs)
+        self.label = MathTex(label) if isinstance(label, str) else label
+        equals = MathTex("=").next_to(self.label, RIGHT)
+        self.label.add(equals)
+
+        self.tracker = ValueTracker(0 if var is None else var)
+        self.value = GlyphNumber(self.tracker.get_value(), num_decimal_places)
+        self.value.next_to(self.label, RIGHT)
+        self.value.add_updater(lambda v: v.set_value(self.tracker.get_value()))
+        self.add(self.label, self.value)
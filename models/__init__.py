@@ -0,0 +1,10 @@
+"""
+Economics models, without Manim
+
+all parameters (prices, budgets, utility levels, quantities) can be numbers 
+or numpy arrays, which are broadcast together; results are arrays of the same shape
+"""
+
+from .consumer import IndifferenceCurve, BudgetConstraint
+from .linear import LinearFunction
+from .wealth import UtilityOverWealth, prospect_utility
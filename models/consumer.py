@@ -0,0 +1,75 @@
+import numpy as np
+
+
+class IndifferenceCurve:
+    # utility function: u = sqrt(x*y)
+    # y = u^2/x
+    def __init__(self, u, x_max=10, y_max=10):
+        self.u = u
+        self.f = lambda x: u**2/x
+        # part of the curve inside [0, x_max] x [0, y_max]
+        self.x_range = [self.u**2/y_max, x_max]
+
+    @staticmethod
+    def get_utility(x, y):
+        # utility of bundles (x, y)
+        return np.sqrt(x*y)
+
+    def get_x(self, y):
+        return self.u**2/y
+
+    def get_slope(self, x):
+        # dy/dx of the curve at x (-MRS)
+        return -self.u**2/x**2
+
+    def get_coords(self, x=None, y=None):
+        # return coordinates of a dot on the indifference curve
+        # given the x or y position of the dot
+        if x is not None and y is not None:
+            return (x, y)
+        if x is not None:
+            return (x, self.f(x))
+        if y is not None:
+            return (self.get_x(y), y)
+        return None
+
+
+class BudgetConstraint:
+    # budget constraint px*x + py*y = budget, 
+    # and the highest indifference curve (u = sqrt(x*y)) it reaches
+
+    # class of self.ic
+    indifference_curve_class = IndifferenceCurve
+
+    def __init__(self, px, py, budget, x_max=10, y_max=10):
+        # prices for good x and y
+        self.px = px
+        self.py = py
+        self.budget = budget
+
+        # y = k*x + b
+        k = -px/py
+        b = budget/py
+        self.k, self.b = k, b
+        self.f = lambda x: x*k + b
+        # part of the line inside [0, x_max] x [0, y_max]
+        self.x_range = [np.maximum((y_max - b)/k, 0), np.minimum(budget/px, x_max)]
+
+        # indifference curve
+        self.u = b/(2*np.sqrt(-k))
+        self.ic = self.indifference_curve_class(self.u, x_max=x_max, y_max=y_max)
+        
+        # optimal (tangent) point
+        _x = budget/px/2
+        self.tan_pos = _x, self.f(_x)
+
+    def get_coords(self, x=None, y=None):
+        # return coordinates of a dot on the budget constraint line
+        # given the x or y position of the dot
+        if x is not None and y is not None:
+            return (x, y)
+        if x is not None:
+            return (x, self.f(x))
+        if y is not None:
+            return ((y - self.b)/self.k, y)
+        return None
@@ -0,0 +1,31 @@
+import numpy as np
+
+
+class LinearFunction:
+    # y = k*x + b
+    def __init__(self, k, b, x_range=None, x_max=10, y_max=10):
+        self.k, self.b = k, b
+        self.f = lambda x: k*x + b
+        self.get_x = lambda y: (y - b)/k
+        if x_range is None:
+            self.x_range = self.get_x_range(x_max, y_max)
+        else:
+            self.x_range = x_range
+
+    def get_x_range(self, x_max, y_max):
+        # part of the line inside [0, x_max] x [0, y_max]
+        # (flat lines: x where y = 0 and y = y_max are infinite, the whole [0, x_max])
+        with np.errstate(divide="ignore"):
+            x_0, x_1 = np.divide(-self.b, self.k), np.divide(y_max - self.b, self.k)
+        return [np.clip(np.minimum(x_0, x_1), 0, x_max), np.clip(np.maximum(x_0, x_1), 0, x_max)]
+
+    def get_coords(self, x=None, y=None):
+        # return coordinates of a dot on the line
+        # given the x or y position of the dot
+        if x is not None and y is not None:
+            return (x, y)
+        if x is not None:
+            return (x, self.f(x))
+        if y is not None:
+            return (self.get_x(y), y)
+        return None
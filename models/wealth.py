@@ -0,0 +1,29 @@
+import numpy as np
+
+
+class UtilityOverWealth:
+    # utility function over wealth: u = 2*w^p
+    def __init__(self, p=.5):
+        self.P = p
+        self.f = lambda x: 2*x**self.P
+
+    def get_x(self, y):
+        return (y/2)**(1/self.P)
+
+    def get_coords(self, x=None, y=None):
+        # return coordinates of a dot on the utility function
+        # given the x or y position of the dot
+        if x is not None and y is not None:
+            return (x, y)
+        if x is not None:
+            return (x, self.f(x))
+        if y is not None:
+            return (self.get_x(y), y)
+        return None
+
+
+def prospect_utility(x, alpha=.7, loss_aversion=2):
+    # utility in prospect theory, x = c - r (outcome relative to the reference point)
+    # u = x^alpha for gains, -loss_aversion*(-x)^alpha for losses
+    x = np.asarray(x, dtype=float)
+    return np.where(x >= 0, 1, -loss_aversion)*np.abs(x)**alpha
@@ -0,0 +1,209 @@
+"""
+Helpers for plotting curves on planes with linear axes
+
+Manim is imported lazily, only by the helpers that build mobjects
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+def get_plane_transform(plane):
+    # (origin, unit x, unit y) of a plane with linear axes, in scene coordinates
+    # c2p(x, y) = origin + x*unit_x + y*unit_y
+    origin = plane.c2p(0, 0)
+    return origin, plane.c2p(1, 0) - origin, plane.c2p(0, 1) - origin
+
+
+def coords_to_points(plane, xs, ys):
+    # vectorized plane.c2p for arrays of x and y coordinates
+    origin, unit_x, unit_y = get_plane_transform(plane)
+    return origin + np.outer(xs, unit_x) + np.outer(ys, unit_y)
+
+
+def get_plot_step(plane):
+    # x step used by plane.plot when no step is given
+    return plane.x_range[2]/plane.num_sampled_graph_points_per_tick
+
+
+def get_plot_xs(x_range, step):
+    # same samples as plane.plot: [x_min, x_min + step, ..., x_max]
+    return np.append(np.arange(x_range[0], x_range[1], step), x_range[1])
+
+
+def get_pixel_size():
+    # size of one pixel in scene units
+    from manim import config
+    return config.frame_width/config.pixel_width
+
+
+def get_adaptive_coords(f, x_range, plane, tolerance=1, n_initial=16, max_depth=12, pixel_size=None):
+    # samples of y = f(x) placed where the on-screen distance between the curve
+    # and straight segments through the samples would exceed `tolerance` pixels
+    # (of `pixel_size` scene units, default: manim's config)
+    # f must accept numpy arrays; each refinement pass calls it once
+    origin, unit_x, unit_y = get_plane_transform(plane)
+    to_screen = lambda xs, ys: np.outer(xs, unit_x[:2]) + np.outer(ys, unit_y[:2])
+    tolerance = tolerance*(pixel_size or get_pixel_size())
+
+    xs = np.linspace(*x_range, n_initial)
+    ys = f(xs)
+    for _ in range(max_depth):
+        mid_xs = (xs[:-1] + xs[1:])/2
+        mid_ys = f(mid_xs)
+
+        # distance from the curve's midpoint to the chord, on screen
+        a, b, m = to_screen(xs[:-1], ys[:-1]), to_screen(xs[1:], ys[1:]), to_screen(mid_xs, mid_ys)
+        chord, offset = b - a, m - a
+        cross = chord[:, 0]*offset[:, 1] - chord[:, 1]*offset[:, 0]
+        errors = np.abs(cross)/np.maximum(np.linalg.norm(chord, axis=1), 1e-12)
+
+        split = np.nonzero(errors > tolerance)[0]
+        if len(split) == 0:
+            break
+        xs = np.insert(xs, split + 1, mid_xs[split])
+        ys = np.insert(ys, split + 1, mid_ys[split])
+    return xs, ys
+
+
+def get_adaptive_graph(plane, f, x_range, tolerance=1, **config):
+    # graph of y = f(x) with adaptive samples (see get_adaptive_coords)
+    xs, ys = get_adaptive_coords(f, x_range, plane, tolerance)
+    points = corners_to_bezier_points(coords_to_points(plane, xs, ys))
+    return get_graph_from_points(points, **config)
+
+
+def get_inner_slice(xs, x_range):
+    # slice of sorted samples `xs` lying strictly inside x_range
+    start = np.searchsorted(xs, x_range[0], side="right")
+    end = np.searchsorted(xs, x_range[1], side="left")
+    return slice(start, end)
+
+
+def corners_to_bezier_points(anchors, n_points_per_curve=4):
+    # bezier points of straight segments between consecutive anchors
+    # (same as VMobject.set_points_as_corners, without building a mobject)
+    anchors = np.asarray(anchors, dtype=float)
+    alphas = np.linspace(0, 1, n_points_per_curve).reshape(-1, 1)
+    points = anchors[:-1, None]*(1 - alphas) + anchors[1:, None]*alphas
+    return points.reshape(-1, 3)
+
+
+def get_graph_from_points(points, **config):
+    # graph mobject with given bezier points
+    # points are copied, cached arrays must never be modified in place
+    from manim import VMobject
+    graph = VMobject(**config)
+    graph.points = np.array(points)
+    return graph
+
+
+class CurvePointCache:
+    # LRU cache of bezier points of plotted curves, with hit/miss counters
+    # keys should identify the curve, its x range, the plane transform
+    # (see `get_plane_key`) and sampling settings
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, compute_points):
+        # return cached points for `key`, computing them with `compute_points()` on a miss
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        self.misses += 1
+        points = compute_points()
+        points.setflags(write=False)
+        self.entries[key] = points
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return points
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+    def get_stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries)}
+
+    @staticmethod
+    def get_plane_key(plane, decimals=6):
+        # hashable key for the position and scale of a plane
+        return tuple(np.round(np.concatenate(get_plane_transform(plane)), decimals))
+
+
+def segments_to_bezier_points(starts, ends, n_points_per_curve=4):
+    # bezier points of disjoint straight segments starts[i] -> ends[i]
+    starts, ends = np.asarray(starts, dtype=float), np.asarray(ends, dtype=float)
+    alphas = np.linspace(0, 1, n_points_per_curve).reshape(-1, 1)
+    points = starts[:, None]*(1 - alphas) + ends[:, None]*alphas
+    return points.reshape(-1, 3)
+
+
+# marching squares
+# corners of a grid cell: 0: (x0, y0), 1: (x1, y0), 2: (x1, y1), 3: (x0, y1)
+# edges of a grid cell, as pairs of corners
+CELL_EDGES = ((0, 1), (1, 2), (3, 2), (0, 3))
+
+
+def _get_case_segments():
+    # (16, 2, 2) table: for each case (bit i set = corner i above the level)
+    # up to two segments, each as a pair of edges; -1 for no segment
+    table = -np.ones((16, 2, 2), dtype=int)
+    for case in range(16):
+        above = [(case >> i) & 1 for i in range(4)]
+        crossed = [e for e, (a, b) in enumerate(CELL_EDGES) if above[a] != above[b]]
+        if len(crossed) == 2:
+            table[case, 0] = crossed
+        elif len(crossed) == 4:
+            # saddle: cut off each corner above the level
+            corners = [c for c in range(4) if above[c]]
+            for i, c in enumerate(corners):
+                table[case, i] = [e for e in crossed if c in CELL_EDGES[e]]
+    return table
+
+
+CASE_SEGMENTS = _get_case_segments()
+
+
+def get_contour_segments(xs, ys, values, levels):
+    # iso-lines of values[j, i] = f(xs[i], ys[j]) for all levels at once
+    # return (level indices, segment starts, segment ends), starts/ends as (n, 2) coords
+    values = np.asarray(values, dtype=float)
+    levels = np.asarray(levels, dtype=float)
+
+    # corner values of every cell: (4, ny - 1, nx - 1)
+    corners = np.stack((values[:-1, :-1], values[:-1, 1:], values[1:, 1:], values[1:, :-1]))
+    above = corners[None] > levels[:, None, None, None]
+    cases = (above*(1 << np.arange(4))[None, :, None, None]).sum(axis=1)
+
+    # only cells crossed by a level
+    level_i, row, col = np.nonzero((cases != 0) & (cases != 15))
+    cell_cases = cases[level_i, row, col]
+
+    # crossing point on each edge of the crossed cells: (n, 4, 2)
+    cell_corners = corners[:, row, col].T
+    corner_coords = np.stack((
+        np.stack((xs[col], ys[row]), axis=-1), 
+        np.stack((xs[col + 1], ys[row]), axis=-1), 
+        np.stack((xs[col + 1], ys[row + 1]), axis=-1), 
+        np.stack((xs[col], ys[row + 1]), axis=-1), 
+    ), axis=1)
+    a, b = np.array(CELL_EDGES).T
+    va, vb = cell_corners[:, a], cell_corners[:, b]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.clip(np.nan_to_num((levels[level_i, None] - va)/(vb - va)), 0, 1)
+    edge_points = corner_coords[:, a]*(1 - t[..., None]) + corner_coords[:, b]*t[..., None]
+
+    # one or two segments per crossed cell
+    segments = CASE_SEGMENTS[cell_cases]
+    cell_i, seg_i = np.nonzero(segments[:, :, 0] >= 0)
+    edges = segments[cell_i, seg_i]
+    starts = edge_points[cell_i, edges[:, 0]]
+    ends = edge_points[cell_i, edges[:, 1]]
+    return level_i[cell_i], starts, ends
@@ -0,0 +1,184 @@
+"""
+Where the time of a render goes: sections, plays, updaters and frame rendering
+
+    RENDER_PROFILE=media/profiles manim -ql demand_curve.py IndifferenceCurveIntro
+    python profiler.py media/profiles/IndifferenceCurveIntro.json [--sort calls]
+
+scenes deriving from ProfiledScene (all scenes based on FrameRangeScene or
+SectionedScene) record, when RENDER_PROFILE is set, the wall time and number of
+calls of every animation_N section, play() call, updater (named by mobject
+class and source line) and of rendering the frames. at the end of the render
+the records are written to <RENDER_PROFILE>/<scene>.json and .txt (a table
+sorted by total time)
+
+with RENDER_PROFILE_MEMORY=1 the memory allocated (net) is recorded as well.
+it is traced with tracemalloc, which slows down every allocation, so the
+times of such a render are inflated; time and memory are best profiled in
+separate renders
+"""
+
+import argparse
+import functools
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+from manim import *
+
+# directory of the reports; unset: no profiling
+PROFILE_ENV = "RENDER_PROFILE"
+# set: also record allocated memory (slows down the render)
+PROFILE_MEMORY_ENV = "RENDER_PROFILE_MEMORY"
+
+COLUMNS = ("kind", "name", "calls", "total_s", "mean_ms", "max_ms", "per_frame_ms", "alloc_kb")
+
+
+def get_updater_name(mobject, updater):
+    # "<mobject class> <file>:<line>" of the function an updater was written as
+    while hasattr(updater, "updater"): # dependencies.dependent_updater
+        updater = updater.updater
+    code = getattr(updater, "__code__", None)
+    if code is None:
+        return f"{type(mobject).__name__} {updater!r}"
+    return f"{type(mobject).__name__} {os.path.basename(code.co_filename)}:{code.co_firstlineno}"
+
+
+class Profiler:
+    def __init__(self, trace_memory=False):
+        # (kind, name) -> [calls, total seconds, max seconds, allocated bytes]
+        self.records = {}
+        self.frames = 0
+        self.trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def get_memory(self):
+        return tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+
+    @contextmanager
+    def measure(self, kind, name):
+        memory = self.get_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            record = self.records.setdefault((kind, name), [0, 0., 0., 0])
+            record[0] += 1
+            record[1] += duration
+            record[2] = max(record[2], duration)
+            record[3] += self.get_memory() - memory
+
+    def wrap(self, kind, name, function):
+        @functools.wraps(function)
+        def measured(*args, **kwargs):
+            with self.measure(kind, name):
+                return function(*args, **kwargs)
+        measured.profiled = True
+        return measured
+
+    def wrap_updaters(self, mobjects):
+        # measure every updater of `mobjects` and their families (once per updater)
+        for mob in mobjects:
+            for m in mob.get_family():
+                for i, updater in enumerate(m.updaters):
+                    if not getattr(updater, "profiled", False):
+                        m.updaters[i] = self.wrap("updater", get_updater_name(m, updater), updater)
+
+    def get_rows(self, sort="total_s"):
+        rows = []
+        for (kind, name), (calls, total, longest, allocated) in self.records.items():
+            rows.append({
+                "kind": kind, "name": name, "calls": calls, "total_s": total,
+                "mean_ms": total/calls*1000, "max_ms": longest*1000,
+                "per_frame_ms": total/max(self.frames, 1)*1000,
+                "alloc_kb": allocated/1024 if self.trace_memory else None
+            })
+        return sort_rows(rows, sort)
+
+    def write_report(self, directory, scene_name):
+        os.makedirs(directory, exist_ok=True)
+        rows = self.get_rows()
+        path = os.path.join(directory, scene_name)
+        with open(path + ".json", "w") as f:
+            json.dump({"scene": scene_name, "frames": self.frames, "rows": rows}, f, indent=2)
+        with open(path + ".txt", "w") as f:
+            f.write(format_table(rows, self.frames))
+        return path + ".json"
+
+
+def sort_rows(rows, sort="total_s"):
+    # rows without the column (alloc_kb without RENDER_PROFILE_MEMORY) sort as 0
+    return sorted(rows, key=lambda row: row[sort] or 0, reverse=sort not in ("kind", "name"))
+
+
+def format_table(rows, frames):
+    lines = [
+        f"{frames} frames",
+        f"{'kind':<9}{'name':<48}{'calls':>8}{'total s':>10}{'mean ms':>10}{'max ms':>10}{'ms/frame':>10}{'alloc KB':>11}"
+    ]
+    for row in rows:
+        alloc = "-" if row["alloc_kb"] is None else f"{row['alloc_kb']:.0f}"
+        lines.append(
+            f"{row['kind']:<9}{row['name'][:47]:<48}{row['calls']:>8}{row['total_s']:>10.3f}"
+            f"{row['mean_ms']:>10.2f}{row['max_ms']:>10.2f}{row['per_frame_ms']:>10.2f}{alloc:>11}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+class ProfiledScene(Scene):
+    # scene recording a profile when RENDER_PROFILE is set (see module docstring)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.profiler = None
+        if os.environ.get(PROFILE_ENV):
+            self.profiler = Profiler(trace_memory=bool(os.environ.get(PROFILE_MEMORY_ENV)))
+        if self.profiler is not None:
+            render = self.renderer.render
+
+            def render_frame(*args, **kwargs):
+                self.profiler.frames += 1
+                with self.profiler.measure("render", "frame"):
+                    return render(*args, **kwargs)
+            self.renderer.render = render_frame
+
+    def measure(self, kind, name):
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.measure(kind, name)
+
+    def play(self, *args, **kwargs):
+        with self.measure("play", f"#{self.renderer.num_plays}"):
+            return super().play(*args, **kwargs)
+
+    def update_mobjects(self, dt):
+        if self.profiler is not None:
+            self.profiler.wrap_updaters(self.mobjects)
+        super().update_mobjects(dt)
+
+    def tear_down(self):
+        super().tear_down()
+        if self.profiler is not None:
+            path = self.profiler.write_report(os.environ[PROFILE_ENV], type(self).__name__)
+            logger.info(f"profile written to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("report", help="json report")
+    parser.add_argument("--sort", default="total_s", choices=COLUMNS)
+    parser.add_argument("--kind", choices=["section", "play", "updater", "render"])
+    args = parser.parse_args()
+
+    with open(args.report) as f:
+        report = json.load(f)
+    rows = [row for row in report["rows"] if args.kind in (None, row["kind"])]
+    print(format_table(sort_rows(rows, args.sort), report["frames"]), end="")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+Render every scene of the gallery in parallel
+
+    python render_gallery.py [-q l] [--format gif] [--jobs N] [--scenes A B ...] [--out out] [--no-dedupe] [--colors N]
+
+one job per artifact of out/manifest.json and format listed for it (a section
+animation_N of a sectioned scene, or a whole scene: section None, e.g. the
+init-only UtilityIntro.png), with the artifact's GIF palette size; `--format`
+and `--colors` override them for every job. sections the manifest doesn't list
+(new animation_N of a listed scene, all sections of a scene it doesn't list,
+or the scene itself if it has no sections) get a gif job, with a warning to add
+them to the manifest. jobs run as separate
+manim processes, as many at a time as there are cores. each job has its own media dir, so jobs of the same scene
+don't share partial movie files; compiled LaTeX/Text is shared through
+tex_cache.py. the rendered movies are re-encoded (held
+frames merged, GIFs with a shared palette, see encode.py). prints how long
+each job took
+"""
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import tex_cache
+from encode import optimize
+from scene_index import find_all_scenes
+
+# same as sections.SECTIONS_ENV (not imported: this process doesn't need manim)
+SECTIONS_ENV = "RENDER_SECTIONS"
+
+JOBS_DIR = os.path.join("media", "jobs")
+
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "out", "manifest.json")
+# GIF palette size of artifacts without `colors`
+DEFAULT_COLORS = 256
+
+
+class RenderJob:
+    def __init__(self, path, scene, section=None, file_format="gif", colors=256):
+        self.path = path
+        self.scene = scene
+        self.section = section
+        self.file_format = file_format
+        # GIF palette size
+        self.colors = colors
+        # same names as the files in out/, e.g. IndifferenceCurveIntro-4
+        self.name = scene if section is None else f"{scene}-{section}"
+        self.media_dir = os.path.join(JOBS_DIR, f"{self.name}.{file_format}")
+        self.duration = None
+        self.returncode = None
+        self.output = None
+        self.encode_report = None
+
+    def get_command(self, quality):
+        if self.file_format == "png":
+            # last frame only
+            format_args = ["-s"]
+        else:
+            format_args = ["--format", self.file_format]
+        return [
+            sys.executable, "-m", "manim", "render", "-q", quality, *format_args, 
+            "--media_dir", self.media_dir, "-o", self.name, self.path, self.scene
+        ]
+
+    def run(self, quality, dedupe_frames=True):
+        env = dict(os.environ)
+        if self.section is not None:
+            env[SECTIONS_ENV] = str(self.section)
+        os.makedirs(self.media_dir, exist_ok=True)
+        tex_cache.restore(self.media_dir)
+
+        start = time.perf_counter()
+        with open(os.path.join(self.media_dir, "render.log"), "w") as log:
+            self.returncode = subprocess.call(
+                self.get_command(quality),
+                env=env, stdout=log, stderr=subprocess.STDOUT
+            )
+        tex_cache.publish(self.media_dir)
+        self.output = self.find_output()
+        if dedupe_frames and self.output:
+            self.encode_report = optimize(self.output, self.colors)
+        self.duration = time.perf_counter() - start
+        return self
+
+    def find_output(self):
+        # rendered movie, or image for scenes without animations
+        pattern = os.path.join(self.media_dir, "**", f"{self.name}.{self.file_format}")
+        for path in glob.glob(pattern, recursive=True):
+            if "partial_movie_files" not in path:
+                return path
+        return None
+
+
+def load_artifacts():
+    # artifacts of out/manifest.json (see manifest.py), [] without a manifest
+    if not os.path.exists(MANIFEST_PATH):
+        return []
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)["artifacts"]
+
+
+def get_jobs(scene_names=None, file_format=None, colors=None):
+    # file_format, colors: for every job instead of the manifest's
+    jobs = []
+    listed = set()
+    for artifact in load_artifacts():
+        listed.add((artifact["scene"], artifact["section"]))
+        if scene_names and artifact["scene"] not in scene_names:
+            continue
+        formats = [file_format] if file_format else artifact["formats"]
+        jobs.extend(
+            RenderJob(
+                artifact["module"], artifact["scene"], artifact["section"], f,
+                colors or artifact.get("colors", DEFAULT_COLORS)
+            )
+            for f in formats
+        )
+
+    for path, scenes in find_all_scenes().items():
+        for scene, sections in scenes:
+            if scene_names and scene not in scene_names:
+                continue
+            for n in sections or [None]:
+                if (scene, n) in listed:
+                    continue
+                job = RenderJob(path, scene, n, file_format or "gif", colors or DEFAULT_COLORS)
+                print(f"{job.name} is not in {MANIFEST_PATH}, rendered as {job.file_format}")
+                jobs.append(job)
+    return jobs
+
+
+def get_n_cores():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def print_summary(jobs, wall_time):
+    print(f"\n{'job':<40}{'seconds':>10}  result")
+    for job in sorted(jobs, key=lambda job: -job.duration):
+        result = "ok" if job.returncode == 0 else f"failed ({os.path.join(job.media_dir, 'render.log')})"
+        print(f"{job.name + '.' + job.file_format:<40}{job.duration:>10.1f}  {result}")
+    total = sum(job.duration for job in jobs)
+    print(f"\n{len(jobs)} jobs, {total:.1f}s of rendering in {wall_time:.1f}s ({total/max(wall_time, 1e-9):.1f}x)")
+
+
+def run_jobs(jobs, quality="l", n_workers=None, out=None, dedupe_frames=True):
+    # render jobs in parallel; copy results to `out` if given
+    n_workers = n_workers or get_n_cores()
+    print(f"rendering {len(jobs)} jobs with {n_workers} workers")
+
+    start = time.perf_counter()
+    # each job is a manim process; threads only wait for them
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        for job in pool.map(lambda job: job.run(quality, dedupe_frames), jobs):
+            print(f"{'done' if job.returncode == 0 else 'FAILED':<8}{job.name}.{job.file_format} ({job.duration:.1f}s)")
+            if job.encode_report:
+                print(f"{'':<8}{job.encode_report}")
+            if out and job.output:
+                os.makedirs(out, exist_ok=True)
+                shutil.copy(job.output, out)
+    print_summary(jobs, time.perf_counter() - start)
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-q", "--quality", default="l", choices=list("lmhpk"))
+    parser.add_argument(
+        "--format", choices=["png", "gif", "mp4", "webm", "mov"],
+        help="for every job (default: the formats of each artifact in out/manifest.json)"
+    )
+    parser.add_argument("--jobs", type=int, default=get_n_cores())
+    parser.add_argument("--scenes", nargs="*", help="only render these scenes")
+    parser.add_argument("--out", help="copy rendered files to this directory (e.g. out)")
+    parser.add_argument("--no-dedupe", action="store_true", help="don't re-encode rendered movies")
+    parser.add_argument("--colors", type=int, help="GIF palette size (3-256) for every job (default: the manifest's)")
+    args = parser.parse_args()
+
+    jobs = get_jobs(args.scenes, args.format, args.colors)
+    jobs = run_jobs(jobs, args.quality, args.jobs, args.out, not args.no_dedupe)
+    return 0 if all(job.returncode == 0 for job in jobs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+List the scenes of the scene modules and their sections (animation_N methods)
+without importing the modules, or Manim
+
+    python scene_index.py [module.py ...]
+"""
+
+import ast
+import re
+import sys
+
+SCENE_MODULES = ("demand_curve.py", "expected_utility_theory.py", "SD_curves.py", "demand_curve_old.py")
+
+# base classes of scenes defined outside the scene modules
+SCENE_BASES = {"Scene", "MovingCameraScene", "ThreeDScene", "SectionedScene", "FrameRangeScene", "StaticLayerScene", "ProfiledScene", "SceneLifecycle"}
+
+SECTION_PATTERN = re.compile(r"animation_(\d+)$")
+
+
+def get_base_name(node):
+    # `Scene` for both `Scene` and `manim.Scene`
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return None
+
+
+def find_scenes(path):
+    # [(scene name, [section numbers])] for every Scene subclass defined in `path`
+    with open(path) as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    scene_names = set(SCENE_BASES)
+    scenes = []
+    # classes may derive from scenes defined above them in the module
+    for node in classes:
+        if any(get_base_name(base) in scene_names for base in node.bases):
+            scene_names.add(node.name)
+            sections = []
+            for item in node.body:
+                match = isinstance(item, ast.FunctionDef) and SECTION_PATTERN.match(item.name)
+                if match:
+                    sections.append(int(match.group(1)))
+            scenes.append((node.name, sorted(sections)))
+    return scenes
+
+
+def find_all_scenes(paths=SCENE_MODULES):
+    # {module path: [(scene name, [section numbers])]}
+    return {path: find_scenes(path) for path in paths}
+
+
+if __name__ == "__main__":
+    paths = sys.argv[1:] or SCENE_MODULES
+    for path, scenes in find_all_scenes(paths).items():
+        print(path)
+        for name, sections in scenes:
+            print(f"    {name}" + (f" (sections: {', '.join(map(str, sections))})" if sections else ""))
@@ -0,0 +1,94 @@
+"""
+Mobjects and updaters owned by the sections of a scene
+
+scenes protect the mobjects of their init (planes, graphs, labels) with
+`self.protect(...)`; everything else added while a section runs is owned by
+that section. `clean()` removes all unprotected mobjects in one pass and
+detaches their updaters, and the updaters the section attached to protected
+mobjects, so they don't keep running in the sections after it. protected and
+section mobjects are kept in sets (mobjects compare by identity)
+
+mobjects of a section still in the scene after it (and updaters it attached
+that are still running) are logged as leaks when the section ends
+"""
+
+from manim import *
+
+
+def get_updaters(mobjects):
+    # updaters of `mobjects` and their families (unwrapped, see profiler.py)
+    return {
+        getattr(updater, "__wrapped__", updater)
+        for mob in mobjects for m in mob.get_family() for updater in m.updaters
+    }
+
+
+def detach_updaters(mobjects, keep=()):
+    # remove the updaters of `mobjects` and their families that aren't in `keep`
+    for mob in mobjects:
+        for m in mob.get_family():
+            m.updaters = [u for u in m.updaters if getattr(u, "__wrapped__", u) in keep]
+
+
+class SceneLifecycle(Scene):
+    # scene tracking protected and section mobjects (see module docstring)
+    # state of the scene's content, kept in checkpoints (see sections.py)
+    LIFECYCLE_ATTRIBUTES = ("protected_mobjects", "section_mobjects", "section_updaters")
+    # add_mobjects/remove_mobjects add and remove without fading
+    FADE_ANIMATION_OFF = False
+
+    def setup(self):
+        super().setup()
+        self.protected_mobjects = set()
+        # mobjects added since the section started, updaters running when it started
+        self.section_mobjects = set()
+        self.section_updaters = set()
+
+    def protect(self, *mobjects):
+        # keep `mobjects` in clean()
+        self.protected_mobjects.update(mobjects)
+        return mobjects
+
+    def add(self, *mobjects):
+        self.section_mobjects.update(mobjects)
+        return super().add(*mobjects)
+
+    def start_section(self):
+        self.section_mobjects = set()
+        self.section_updaters = get_updaters(self.mobjects)
+
+    def clean(self):
+        # remove every unprotected mobject and the updaters attached in this section
+        removed = [m for m in self.mobjects if m not in self.protected_mobjects]
+        self.mobjects = [m for m in self.mobjects if m in self.protected_mobjects]
+        self.foreground_mobjects = [m for m in self.foreground_mobjects if m in self.protected_mobjects]
+        detach_updaters(removed)
+        detach_updaters(self.mobjects, keep=self.section_updaters)
+
+    def get_leaks(self):
+        # (mobjects added in this section still in the scene, updaters attached in it still running)
+        mobjects = [m for m in self.mobjects if m in self.section_mobjects and m not in self.protected_mobjects]
+        return mobjects, get_updaters(self.mobjects) - self.section_updaters
+
+    def report_leaks(self, name):
+        mobjects, updaters = self.get_leaks()
+        if mobjects or updaters:
+            names = ", ".join(type(m).__name__ for m in mobjects)
+            logger.info(f"{name} left {len(mobjects)} mobjects ({names}) and {len(updaters)} updaters in the scene")
+        return mobjects, updaters
+
+    def add_mobjects(self, *args, animation=FadeIn, **kwargs):
+        if self.FADE_ANIMATION_OFF and animation == FadeIn:
+            animation = None
+        if animation is None:
+            self.add(*args)
+        else:
+            self.play(animation(Group(*args)), **kwargs)
+
+    def remove_mobjects(self, *args, animation=FadeOut, **kwargs):
+        if self.FADE_ANIMATION_OFF and animation == FadeOut:
+            animation = None
+        if animation is not None:
+            self.play(animation(Group(*args)), **kwargs)
+        self.remove(*args)
+        detach_updaters(args)
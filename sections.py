@@ -0,0 +1,192 @@
+"""
+Render single sections (animation_N methods) of a scene
+
+    python sections.py demand_curve.py IndifferenceCurveIntro --section 5 [manim options]
+
+scenes deriving from SectionedScene run `init` and then their sections in order;
+the scene state at each section boundary is saved as a checkpoint, so rendering
+a later section restores it instead of replaying the sections before it.
+sections that are only replayed are never rendered (manim's skip_animations)
+
+checkpoints need `dill` (updaters and models hold lambdas); without it,
+earlier sections are replayed without rendering. checkpoints are keyed on the
+source of the scene module and of the local modules it imports, the resolution
+and the frame rate; one that can't be loaded is replayed instead. frame part
+workers (frame_parallel.py) don't use checkpoints: they would race on them, and
+a worker that loads one numbers its plays differently from one that replays
+
+when only the last frame is saved (`manim -s`, the png files of the gallery),
+manim skips every play: each jumps to the end state of its animations, and
+nothing of a skipped play is rasterized (not its frames, see FrameRangeScene,
+nor its background or frozen wait frame, see static_layer.py). one frame is
+rasterized at the end; the last selected section doesn't run end_section, so
+the image shows its final state
+
+mobjects a section leaves in the scene are logged (see scene_lifecycle.py)
+"""
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import os
+import subprocess
+import sys
+
+from manim import *
+
+from frame_parallel import FrameRangeScene, get_frame_part
+from manifest import get_module_dependencies, read_source
+from scene_lifecycle import SceneLifecycle
+
+try:
+    import dill
+except ImportError:
+    dill = None
+
+CHECKPOINT_DIR = os.path.join("media", "checkpoints")
+
+# sections to render, e.g. "5" or "3,5"; unset: the scene's SECTIONS
+SECTIONS_ENV = "RENDER_SECTIONS"
+
+
+def get_selected_sections():
+    value = os.environ.get(SECTIONS_ENV)
+    if not value:
+        return None
+    return sorted(int(n) for n in value.split(","))
+
+
+@functools.lru_cache()
+def get_source_hash(module):
+    # hash of the sources of local module `module` and the local modules it imports
+    digest = hashlib.sha1()
+    for path in sorted(get_module_dependencies(module)):
+        digest.update(path.encode())
+        digest.update(read_source(path).encode())
+    return digest.hexdigest()[:12]
+
+
+class SectionedScene(SceneLifecycle, FrameRangeScene):
+    # scene made of init() and sections animation_1, animation_2, ...
+    # sections rendered by default, in order
+    SECTIONS = ()
+    # attributes of the scene kept in checkpoints, with the lifecycle sets and the
+    # attributes init and the sections add (not manim's per-play state)
+    STATE_ATTRIBUTES = ("mobjects", "foreground_mobjects")
+
+    def setup(self):
+        super().setup()
+        # attributes added by init and the sections
+        self.state_attributes = set()
+
+    def construct(self):
+        sections = get_selected_sections() or list(self.SECTIONS)
+        if not sections:
+            self.run_init()
+            return
+
+        # sections between the first and last selected ones are replayed, not rendered
+        first, last = sections[0], sections[-1]
+        if not self.load_checkpoint(first):
+            self.next_section("init", skip_animations=True)
+            self.run_init()
+            for n in self.get_all_sections():
+                if n >= first:
+                    break
+                self.save_checkpoint(n)
+                self.next_section(f"animation_{n}", skip_animations=True)
+                self.run_section(n)
+
+        for n in self.get_all_sections():
+            if first <= n <= last:
+                self.save_checkpoint(n)
+                self.next_section(f"animation_{n}", skip_animations=n not in sections)
+                self.run_section(n, is_last=n == last)
+
+    def end_section(self, n):
+        # called after section n, e.g. to clean up before the next one
+        pass
+
+    @contextlib.contextmanager
+    def recording_state(self):
+        # attributes added to the scene in the block are part of its state
+        names = set(self.__dict__)
+        yield
+        self.state_attributes.update(set(self.__dict__) - names)
+
+    def run_init(self):
+        with self.recording_state(), self.measure("section", "init"):
+            self.init()
+
+    def run_section(self, n, is_last=False):
+        self.start_section()
+        with self.recording_state(), self.measure("section", f"animation_{n}"):
+            getattr(self, f"animation_{n}")()
+        # nothing comes after the last section, and its state is the still image
+        if not is_last:
+            self.end_section(n)
+            self.report_leaks(f"animation_{n}")
+
+    def get_all_sections(self):
+        names = (name for name in dir(self) if name.startswith("animation_"))
+        return sorted(int(name[len("animation_"):]) for name in names if name[len("animation_"):].isdigit())
+
+    # checkpoints
+    def use_checkpoints(self):
+        return dill is not None and get_frame_part() is None
+
+    def get_checkpoint_path(self, n):
+        # state before section n, for the current source of the scene module and the
+        # local modules it imports (curves, mobjects, ...: their classes are pickled),
+        # and the current resolution (graphs are sampled per pixel) and frame rate
+        module = os.path.splitext(os.path.basename(inspect.getsourcefile(type(self))))[0]
+        source_hash = get_source_hash(module)
+        name = f"{source_hash}_{config.pixel_width}x{config.pixel_height}_{config.frame_rate:g}fps_before_{n}.pkl"
+        return os.path.join(CHECKPOINT_DIR, type(self).__name__, name)
+
+    def get_state(self):
+        names = (
+            *self.STATE_ATTRIBUTES, *self.LIFECYCLE_ATTRIBUTES, "state_attributes", *sorted(self.state_attributes)
+        )
+        return {name: self.__dict__[name] for name in names}
+
+    def save_checkpoint(self, n):
+        path = self.get_checkpoint_path(n)
+        # profiled updaters would take the profiler into the checkpoint
+        if not self.use_checkpoints() or os.path.exists(path) or self.profiler is not None:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            # one dump, so mobjects shared by attributes and updaters stay shared
+            data = dill.dumps(self.get_state(), recurse=True)
+        except Exception as e:
+            logger.warning(f"no checkpoint before animation_{n}: {e}")
+            return
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+
+    def load_checkpoint(self, n):
+        path = self.get_checkpoint_path(n)
+        if not self.use_checkpoints() or not os.path.exists(path):
+            return False
+        try:
+            with open(path, "rb") as f:
+                state = dill.load(f)
+        except Exception as e:
+            logger.warning(f"checkpoint before animation_{n} not loaded, replaying: {e}")
+            return False
+        self.__dict__.update(state)
+        logger.info(f"restored checkpoint before animation_{n}")
+        return True
+
+
+if __name__ == "__main__":
+    # python sections.py <file> <scene> --section N[,M] [manim options]
+    args = sys.argv[1:]
+    if "--section" in args:
+        i = args.index("--section")
+        os.environ[SECTIONS_ENV] = args[i + 1]
+        del args[i:i + 2]
+    sys.exit(subprocess.call([sys.executable, "-m", "manim", "render", *args]))
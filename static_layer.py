@@ -0,0 +1,110 @@
+"""
+Static background layer (planes, axes, labels) rasterized once per scene
+
+manim's cairo renderer already draws the mobjects that don't move in a play()
+once, as the background of its frames, but only those before the first moving
+mobject in scene.mobjects, and again for every play. mobjects marked with
+`scene.mark_static(...)` are always part of that background, and the background
+is only rasterized again when the static mobjects changed (their points, colors
+or strokes)
+
+this changes the drawing order: while anything moves, marked mobjects are drawn
+under all moving mobjects, even those added before them (or with a lower
+z_index). only mark mobjects that nothing moving should pass under: planes,
+axes and their labels
+
+plays manim skips (`-n`, `-s`, skipped sections) write no frames, so their
+background and the frame of frozen waits aren't rasterized either
+"""
+
+import hashlib
+
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+
+
+def mark_static(*mobjects):
+    # the marks are attributes of the mobjects, so they are kept in checkpoints
+    for mob in mobjects:
+        for m in mob.get_family():
+            m.static_layer = True
+    return mobjects
+
+
+def get_static_key(mobjects):
+    # hash of what a rasterization of `mobjects` depends on
+    digest = hashlib.sha1()
+    for m in mobjects:
+        digest.update(str(id(m)).encode())
+        for name in ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "pixel_array"):
+            value = getattr(m, name, None)
+            if isinstance(value, np.ndarray):
+                digest.update(np.ascontiguousarray(value).tobytes())
+        for name in ("stroke_width", "background_stroke_width", "z_index"):
+            digest.update(repr(getattr(m, name, None)).encode())
+    return digest.hexdigest()
+
+
+class StaticLayerRenderer(CairoRenderer):
+    # CairoRenderer that reuses the background of the previous play if it didn't change
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.static_layer_key = None
+        self.static_layer_image = None
+        self.is_playing = False
+
+    def play(self, scene, *args, **kwargs):
+        self.is_playing = True
+        try:
+            super().play(scene, *args, **kwargs)
+        finally:
+            self.is_playing = False
+
+    def update_frame(self, scene, *args, **kwargs):
+        # frozen frames of skipped waits (the frame of a still image is updated after the plays)
+        if self.is_playing and self.skip_animations:
+            return
+        super().update_frame(scene, *args, **kwargs)
+
+    def freeze_current_frame(self, duration):
+        if self.skip_animations:
+            return
+        super().freeze_current_frame(duration)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        if not static_mobjects or self.skip_animations:
+            self.static_image = None
+            return None
+        key = (
+            get_static_key(static_mobjects),
+            self.camera.pixel_width, self.camera.pixel_height, str(self.camera.background_color)
+        )
+        if key != self.static_layer_key:
+            self.static_layer_image = super().save_static_frame_data(scene, static_mobjects)
+            self.static_layer_key = key
+        self.static_image = self.static_layer_image
+        return self.static_image
+
+
+class StaticLayerScene(Scene):
+    # scene whose mobjects can be marked as static background (see module docstring)
+    def __init__(self, renderer=None, **kwargs):
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = StaticLayerRenderer(
+                camera_class=kwargs.get("camera_class", Camera),
+                skip_animations=kwargs.get("skip_animations", False)
+            )
+        super().__init__(renderer=renderer, **kwargs)
+
+    def mark_static(self, *mobjects):
+        return mark_static(*mobjects)
+
+    def get_moving_mobjects(self, *animations):
+        # static mobjects are not moving, unless animated or updated
+        # (so they are drawn under the moving ones, see module docstring)
+        moving = super().get_moving_mobjects(*animations)
+        animated = {m for animation in animations for m in animation.mobject.get_family()}
+        return [
+            m for m in moving
+            if not getattr(m, "static_layer", False) or m in animated or m.updaters
+        ]
@@ -0,0 +1,83 @@
+"""
+dependent_updater skipping and chains (numpy only: trackers and mobjects are plain objects)
+
+run from the repository root with `python -m pytest tests`
+"""
+
+from dependencies import dependent_updater
+
+
+class Tracker:
+    # the part of ValueTracker dependent_updater uses
+    def __init__(self, value):
+        self.value = value
+
+    def get_value(self):
+        return self.value
+
+
+class Mob:
+    # a mobject without get_value, compared by its update_version
+    pass
+
+
+def counting_updater(counts, name):
+    def updater(mob):
+        counts[name] = counts.get(name, 0) + 1
+    return updater
+
+
+def test_skips_until_the_tracker_changes():
+    counts = {}
+    tracker, dot = Tracker(0), Mob()
+    update = dependent_updater(counting_updater(counts, "dot"), tracker)
+
+    update(dot)
+    update(dot)
+    assert counts == {"dot": 1}
+    tracker.value = 1
+    update(dot)
+    update(dot)
+    assert counts == {"dot": 2}
+    assert dot.update_version == 2
+    # back to an earlier value is a change too
+    tracker.value = 0
+    update(dot)
+    assert counts == {"dot": 3}
+
+
+def test_chain_runs_only_after_its_input_updated():
+    counts = {}
+    tracker, dot, label = Tracker(0), Mob(), Mob()
+    update_dot = dependent_updater(counting_updater(counts, "dot"), tracker)
+    update_label = dependent_updater(counting_updater(counts, "label"), dot)
+
+    # frames as manim runs them: the dot's updaters before the label's
+    for value in (0, 0, 1, 1, 2):
+        tracker.value = value
+        update_dot(dot)
+        update_label(label)
+    assert counts == {"dot": 3, "label": 3}
+
+
+def test_any_input_change_runs_the_updater():
+    counts = {}
+    x, y, dot = Tracker(0), Tracker(0), Mob()
+    update = dependent_updater(counting_updater(counts, "dot"), x, y)
+
+    update(dot)
+    y.value = 1
+    update(dot)
+    update(dot)
+    x.value = 1
+    update(dot)
+    assert counts == {"dot": 3}
+
+
+def test_exposes_inputs_and_updater():
+    # profiler.py names dependent updaters after the wrapped updater
+    tracker = Tracker(0)
+    updater = lambda mob: None
+    update = dependent_updater(updater, tracker)
+    assert update.inputs == (tracker,)
+    assert update.updater is updater
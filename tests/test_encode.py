@@ -0,0 +1,104 @@
+"""
+Held frame merging and GIF encoding of encode.py (numpy only; the GIF round trip needs Pillow)
+
+run from the repository root with `python -m pytest tests`
+"""
+
+import numpy as np
+import pytest
+
+from encode import GIF_DELAY_UNIT, encode_gif, get_delta_frames, get_gif_durations, get_hold_runs, read_gif
+
+
+def make_frames(values):
+    # 4x4 RGB frames, all pixels equal to each value
+    return [np.full((4, 4, 3), value, dtype=np.uint8) for value in values]
+
+
+def test_hold_runs():
+    frames = make_frames([0, 0, 0, 9, 9, 0])
+    assert get_hold_runs(frames) == [(0, 3), (3, 2), (5, 1)]
+
+
+def test_hold_runs_compare_with_the_first_frame_of_the_run():
+    # each frame is within the threshold of the one before, not of the first:
+    # a slow fade is not merged into one frame
+    frames = make_frames([0, 2, 4, 6])
+    assert get_hold_runs(frames, threshold=2) == [(0, 2), (2, 2)]
+    assert get_hold_runs(frames, threshold=0) == [(0, 1), (1, 1), (2, 1), (3, 1)]
+
+
+def test_hold_runs_of_different_sizes_are_not_merged():
+    frames = [np.zeros((4, 4, 3), np.uint8), np.zeros((4, 5, 3), np.uint8)]
+    assert get_hold_runs(frames) == [(0, 1), (1, 1)]
+
+
+def test_gif_durations_add_up():
+    # 30 fps: 33.3 ms per frame, not a multiple of the 10 ms GIF delay unit
+    durations = [1000/30]*90
+    runs = [(0, 1), (1, 44), (45, 1), (46, 44)]
+    delays = get_gif_durations(runs, durations)
+    assert all(delay % GIF_DELAY_UNIT == 0 for delay in delays)
+    # rounded at run boundaries: the total doesn't drift
+    assert sum(delays) == 3000
+    assert delays == [30, 1470, 30, 1470]
+
+
+def test_gif_durations_are_at_least_one_unit():
+    delays = get_gif_durations([(0, 1), (1, 1), (2, 1)], [4, 4, 4])
+    assert delays == [GIF_DELAY_UNIT]*3
+
+
+def composite(written, transparent):
+    # frames as a GIF decoder shows them with disposal 1 (keep the frame before)
+    canvas = written[0].copy()
+    shown = [canvas.copy()]
+    for frame in written[1:]:
+        canvas = np.where(frame == transparent, canvas, frame)
+        shown.append(canvas.copy())
+    return shown
+
+
+def test_delta_frames_show_the_original_frames():
+    rng = np.random.default_rng(0)
+    transparent = 15
+    indices = [rng.integers(0, transparent, (20, 30), dtype=np.uint8)]
+    for _ in range(5):
+        frame = indices[-1].copy()
+        top, left = rng.integers(0, 15, 2)
+        frame[top:top + 5, left:left + 8] = rng.integers(0, transparent, (5, 8))
+        indices.append(frame)
+    indices.append(indices[-1].copy())
+
+    written, area = get_delta_frames(indices, transparent)
+    for shown, frame in zip(composite(written, transparent), indices):
+        assert np.array_equal(shown, frame)
+    # an unchanged frame has no changed rectangle: it repeats the frame written before
+    assert np.array_equal(written[-1], written[-2])
+    assert 0 < area < 8*5/(20*30)
+
+
+def test_encode_gif_round_trip(tmp_path):
+    pytest.importorskip("PIL")
+    from PIL import Image
+
+    # a square moving over a background, held for a few frames at the end
+    frames = []
+    for i in range(8):
+        frame = np.zeros((32, 48, 3), dtype=np.uint8)
+        frame[:, :, 2] = 80
+        x = min(i, 5)*6
+        frame[10:20, x:x + 10] = (255, 200, 0)
+        frames.append(Image.fromarray(frame))
+    path = str(tmp_path / "square.gif")
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=40, loop=0)
+
+    # (Pillow may already merge the held frames when saving)
+    report = encode_gif(path, colors=16, output=str(tmp_path / "encoded.gif"))
+    assert report["frames"][1] == 6
+    decoded, durations, _ = read_gif(str(tmp_path / "encoded.gif"))
+    kept = [np.asarray(frames[i].convert("RGB")) for i in (0, 1, 2, 3, 4, 5)]
+    assert len(decoded) == len(kept)
+    for frame, original in zip(decoded, kept):
+        assert np.abs(frame.astype(int) - original).max() <= 8
+    assert durations == [40]*5 + [120]
@@ -0,0 +1,34 @@
+"""
+End to end: one frame_parallel worker renders its part of a play
+
+needs manim (skipped without it); run from the repository root with `python -m pytest tests`
+"""
+
+import glob
+import os
+
+import pytest
+
+pytest.importorskip("manim")
+
+import frame_parallel
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_render_part(tmp_path, monkeypatch):
+    # DerivingDemandCurve has a TracedCurve (path dependent): the plays before --play
+    # are replayed frame by frame, and the worker replays the frames before its range
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(frame_parallel, "PARTS_DIR", str(tmp_path / "parts"))
+    path = os.path.join(ROOT, "demand_curve.py")
+
+    worker = frame_parallel.render_part(path, "DerivingDemandCurve", 2, 1, 4, "l")
+    media_dir = tmp_path / "parts" / "DerivingDemandCurve-2" / "1"
+    assert worker.wait(timeout=600) == 0, (media_dir / "render.log").read_text()
+
+    parts = [
+        p for p in glob.glob(str(media_dir / "videos" / "**" / "part_1.mp4"), recursive=True)
+        if "partial_movie_files" not in p
+    ]
+    assert parts and os.path.getsize(parts[0]) > 0
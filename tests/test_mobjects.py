@@ -0,0 +1,52 @@
+"""
+TracedCurve's point buffer under manim's point operations
+
+needs manim (skipped without it); run from the repository root with `python -m pytest tests`
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import VMobject
+
+from mobjects import TracedCurve
+
+
+def make_curve(n):
+    curve = TracedCurve(np.zeros(3), capacity=2)
+    for i in range(1, n + 1):
+        curve.add_point([i, 0, 0])
+    return curve
+
+
+def assert_in_buffer(curve):
+    assert np.shares_memory(curve.points, curve.buffer)
+
+
+def test_points_view_the_buffer():
+    curve = make_curve(5)
+    assert len(curve.points) == 5*curve.n_points_per_cubic_curve
+    assert_in_buffer(curve)
+    assert np.allclose(curve.get_end(), [5, 0, 0])
+
+
+def test_added_points_follow_assigned_points():
+    other = VMobject().set_points_as_corners([[0, 1, 0], [2, 1, 0]])
+    for assign in (
+        lambda curve: curve.set_points(other.points),
+        lambda curve: curve.become(other),
+        lambda curve: curve.reverse_points(),
+        lambda curve: curve.shift([0, 1, 0]),
+        lambda curve: curve.clear_points(),
+    ):
+        curve = make_curve(3)
+        assign(curve)
+        points = np.array(curve.points)
+        assert_in_buffer(curve)
+        curve.add_point([7, 7, 0])
+        assert_in_buffer(curve)
+        # the assigned points are kept, the new segment comes after them
+        assert np.allclose(curve.points[:len(points)], points)
+        assert np.allclose(curve.get_end(), [7, 7, 0])
@@ -0,0 +1,63 @@
+"""
+The Manim-free models (numpy only)
+
+run from the repository root with `python -m pytest tests`
+"""
+
+import numpy as np
+
+import models
+
+
+def test_linear_function_default_range_stays_in_the_plane():
+    # demand line from (0, 10) to (10, 0), supply line through the origin
+    assert np.allclose(models.LinearFunction(-1, 10).x_range, [0, 10])
+    assert np.allclose(models.LinearFunction(1, 0).x_range, [0, 10])
+    # leaves the plane through the bottom at x = 6, or through the top at x = 8/3
+    assert np.allclose(models.LinearFunction(-2, 12).x_range, [1, 6])
+    assert np.allclose(models.LinearFunction(3, 2).x_range, [0, 8/3])
+    # enters through the bottom at x = 2
+    assert np.allclose(models.LinearFunction(.5, -1).x_range, [2, 10])
+    # flat line
+    assert np.allclose(models.LinearFunction(0, 3).x_range, [0, 10])
+
+
+def test_linear_function_explicit_range():
+    assert models.LinearFunction(-1, 10, [3, 7]).x_range == [3, 7]
+
+
+def test_budget_constraint_on_array_prices():
+    # one BudgetConstraint for the prices of every frame (see TrackerTable) gives
+    # the same results as one BudgetConstraint per price
+    pxs = np.linspace(1, 10, 50)
+    bc = models.BudgetConstraint(pxs, 2, 12)
+    qx, qy = bc.tan_pos
+    assert qx.shape == qy.shape == pxs.shape
+    for i, px in enumerate(pxs):
+        single = models.BudgetConstraint(px, 2, 12)
+        assert np.isclose(qx[i], single.tan_pos[0]) and np.isclose(qy[i], single.tan_pos[1])
+        assert np.isclose(bc.u[i], single.u)
+        assert np.allclose([x[i] for x in bc.x_range], single.x_range)
+
+
+def test_budget_constraint_optimum():
+    # u = sqrt(x*y): half the budget is spent on each good, on the highest indifference curve
+    pxs, py, budget = np.array([1., 2, 4, 8]), 2, 12
+    bc = models.BudgetConstraint(pxs, py, budget)
+    qx, qy = bc.tan_pos
+    assert np.allclose(pxs*qx, budget/2)
+    assert np.allclose(py*qy, budget/2)
+    assert np.allclose(models.IndifferenceCurve.get_utility(qx, qy), bc.u)
+    # the indifference curve touches the line at the optimum: same slope
+    assert np.allclose(bc.ic.get_slope(qx), bc.k)
+    assert np.allclose(bc.get_coords(y=qy)[0], qx)
+
+
+def test_indifference_curve_on_arrays():
+    xs = np.linspace(.5, 10, 20)
+    ic = models.IndifferenceCurve(3)
+    assert np.allclose(ic.f(xs), 9/xs)
+    assert np.allclose(models.IndifferenceCurve.get_utility(xs, ic.f(xs)), 3)
+    # utility levels broadcast too
+    us = np.array([1., 2, 3])
+    assert np.allclose(models.IndifferenceCurve(us).f(2), us**2/2)
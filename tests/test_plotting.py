@@ -0,0 +1,77 @@
+"""
+plotting.py helpers against analytic curves
+
+numpy only; run from the repository root with `python -m pytest tests`
+"""
+
+import numpy as np
+
+from plotting import get_adaptive_coords, get_contour_segments
+
+# scene units per pixel at 1280 pixels across the default frame
+PIXEL_SIZE = 14.222/1280
+
+
+class Plane:
+    # the part of manim's Axes the helpers use: c2p of a plane 5 units wide for x in [0, 10]
+    def c2p(self, x, y):
+        return np.array([-7 + .5*x, -2.5 + .5*y, 0])
+
+
+def get_max_error(f, xs, ys, n=50):
+    # largest on-screen distance in pixels between y = f(x) and the chords through (xs, ys)
+    error = 0
+    for x0, x1, y0, y1 in zip(xs[:-1], xs[1:], ys[:-1], ys[1:]):
+        curve_xs = np.linspace(x0, x1, n)
+        chord = .5*np.array([x1 - x0, y1 - y0])
+        offsets = .5*np.stack((curve_xs - x0, f(curve_xs) - y0), axis=1)
+        distances = np.abs(chord[0]*offsets[:, 1] - chord[1]*offsets[:, 0])/np.linalg.norm(chord)
+        error = max(error, distances.max())
+    return error/PIXEL_SIZE
+
+
+def test_contour_segments_follow_level_sets():
+    # iso-utility lines of u = sqrt(x*y) are the indifference curves x*y = u^2
+    xs = ys = np.linspace(0, 10, 301)
+    values = np.sqrt(np.multiply.outer(ys, xs))
+    levels = np.array([1, 2, 3, 5])
+    level_i, starts, ends = get_contour_segments(xs, ys, values, levels)
+
+    assert set(level_i) == set(range(len(levels)))
+    for i, u in enumerate(levels):
+        points = np.concatenate((starts[level_i == i], ends[level_i == i]))
+        assert np.abs(np.sqrt(points[:, 0]*points[:, 1]) - u).max() < 5e-3
+        # from where the curve enters the grid (y = 10) to where it leaves it (x = 10)
+        assert np.isclose(points[:, 0].min(), u**2/10)
+        assert np.isclose(points[:, 0].max(), 10)
+
+
+def test_contour_segments_form_one_chain_per_level():
+    xs = ys = np.linspace(0, 10, 101)
+    values = np.sqrt(np.multiply.outer(ys, xs))
+    # (a level through grid points would also give zero length segments there)
+    level_i, starts, ends = get_contour_segments(xs, ys, values, [2.05])
+
+    # consecutive segments share their endpoints: n segments have n + 1 distinct points
+    points = np.round(np.concatenate((starts, ends)), 9)
+    assert len(np.unique(points, axis=0)) == len(starts) + 1
+
+
+def test_adaptive_coords_within_tolerance():
+    # the indifference curve u = 3 on the default axes
+    f = lambda xs: 9/xs
+    for tolerance in (1, .25):
+        xs, ys = get_adaptive_coords(f, [.9, 10], Plane(), tolerance, pixel_size=PIXEL_SIZE)
+        assert xs[0] == .9 and xs[-1] == 10
+        assert np.all(np.diff(xs) > 0)
+        assert np.allclose(ys, f(xs))
+        assert get_max_error(f, xs, ys) <= tolerance
+        # far fewer samples than plane.plot's 10 per unit
+        assert len(xs) < 92/2
+
+
+def test_adaptive_coords_keep_straight_lines_coarse():
+    f = lambda xs: 10 - 2*xs
+    xs, _ = get_adaptive_coords(f, [0, 5], Plane(), n_initial=16, pixel_size=PIXEL_SIZE)
+    # nothing to refine
+    assert len(xs) == 16
@@ -0,0 +1,72 @@
+"""
+TrackerTable lookups (numpy only, without manim: the table is filled with set_values)
+
+run from the repository root with `python -m pytest tests`
+"""
+
+import numpy as np
+
+from timeline import TrackerTable
+
+
+class Tracker:
+    # the part of ValueTracker a TrackerTable uses
+    def __init__(self, value):
+        self.value = value
+
+    def get_value(self):
+        return self.value
+
+
+def make_table(values):
+    tracker = Tracker(values[0])
+    table = TrackerTable(tracker, square=lambda xs: xs**2)
+    table.set_values(values)
+    return tracker, table
+
+
+def test_frames_in_order_follow_the_row(monkeypatch):
+    values = 1 + 4*np.linspace(0, 1, 61)**2
+    tracker, table = make_table(values)
+    searches = []
+    argmin = np.argmin
+    monkeypatch.setattr(np, "argmin", lambda *args, **kwargs: searches.append(args) or argmin(*args, **kwargs))
+    for i, value in enumerate(values):
+        tracker.value = value
+        # several updaters read the same frame
+        for _ in range(3):
+            assert table.get("square") == values[i]**2
+            assert table.row == i
+    assert not searches
+    assert (table.hits, table.misses) == (3*len(values), 0)
+
+
+def test_jump_searches_the_table():
+    # e.g. the first frame of a frame range starting mid-play
+    values = np.linspace(0, 1, 31)
+    tracker, table = make_table(values)
+    tracker.value = values[20]
+    assert table.get("square") == values[20]**2
+    assert table.row == 20
+    tracker.value = values[21]
+    assert table.get("square") == values[21]**2
+    assert table.row == 21
+
+
+def test_value_not_in_table_is_computed():
+    tracker, table = make_table(np.linspace(0, 1, 31))
+    tracker.value = .123
+    assert np.isclose(table.get("square"), .123**2)
+    assert (table.hits, table.misses) == (0, 1)
+    # the row is kept for the next frames
+    assert table.row == 0
+
+
+def test_set_values_resets_the_row():
+    tracker, table = make_table(np.linspace(0, 1, 11))
+    tracker.value = 1
+    table.get("square")
+    assert table.row == 10
+    table.set_values(np.linspace(1, 2, 11))
+    assert table.row == 0
+    assert table.get("square") == 1
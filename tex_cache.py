@@ -0,0 +1,189 @@
+"""
+LaTeX and Text SVGs shared by all render processes
+
+    python tex_cache.py warm [--jobs N]     # compile the strings typeset by the scene modules
+    python tex_cache.py status
+
+manim compiles each MathTex/Tex/Text string to an SVG named by a hash of its
+content and settings, in <media_dir>/Tex and <media_dir>/texts, and reuses it
+when it exists. render workers (render_gallery, frame_parallel) each have their
+own media dir, so they would all compile the same strings again; instead the
+SVGs are kept in one content-addressed store, media/tex_cache, linked into a
+worker's media dir before it renders and published back after it.
+publishing writes a temporary file and renames it, so concurrent writers of the
+same (identical) SVG never leave a partial file
+
+`warm` compiles every string literal passed to MathTex, Tex, Text, Readout and
+get_axis_labels in the scene modules (and the glyphs of GlyphNumber), so
+renders on a fresh worker don't wait for LaTeX
+"""
+
+import argparse
+import ast
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from scene_index import SCENE_MODULES
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join("media", "tex_cache")
+# manim's tex_dir and text_dir, relative to the media dir
+SUBDIRS = ("Tex", "texts")
+
+# calls whose string arguments are typeset (get_axis_labels: its label keywords, as MathTex)
+TEX_CALLS = {"MathTex", "Tex", "Text", "Readout", "get_axis_labels"}
+LABEL_KEYWORDS = {"x_label", "y_label"}
+
+# characters of GlyphNumber (mobjects.py)
+GLYPHS = list("0123456789-.,") + ["="]
+
+
+def restore(media_dir):
+    # link the cached SVGs into `media_dir` (copies where links aren't possible)
+    for subdir in SUBDIRS:
+        source = os.path.join(CACHE_DIR, subdir)
+        if not os.path.isdir(source):
+            continue
+        target = os.path.join(media_dir, subdir)
+        os.makedirs(target, exist_ok=True)
+        for name in os.listdir(source):
+            if not name.endswith(".svg") or os.path.exists(os.path.join(target, name)):
+                continue
+            try:
+                os.link(os.path.join(source, name), os.path.join(target, name))
+            except OSError:
+                shutil.copyfile(os.path.join(source, name), os.path.join(target, name))
+
+
+def publish(media_dir):
+    # add the SVGs compiled in `media_dir` to the cache; returns how many were new
+    n_new = 0
+    for subdir in SUBDIRS:
+        source = os.path.join(media_dir, subdir)
+        if not os.path.isdir(source):
+            continue
+        target = os.path.join(CACHE_DIR, subdir)
+        os.makedirs(target, exist_ok=True)
+        for name in os.listdir(source):
+            if not name.endswith(".svg") or os.path.exists(os.path.join(target, name)):
+                continue
+            tmp = os.path.join(target, f".{name}.{os.getpid()}.tmp")
+            shutil.copyfile(os.path.join(source, name), tmp)
+            os.replace(tmp, os.path.join(target, name))
+            n_new += 1
+    return n_new
+
+
+def get_call_name(node):
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    return None
+
+
+def find_strings(path):
+    # [(mobject class, [strings], {keyword: source})] typeset in the module at `path`
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    found = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or get_call_name(node) not in TEX_CALLS:
+            continue
+        name = get_call_name(node)
+        if name == "get_axis_labels":
+            for keyword in node.keywords:
+                if keyword.arg in LABEL_KEYWORDS and isinstance(keyword.value, ast.Constant):
+                    found.append(("MathTex", [keyword.value.value], {}))
+            continue
+        strings = [arg.value for arg in node.args if isinstance(arg, ast.Constant) and isinstance(arg.value, str)]
+        if name == "Readout":
+            # Readout(var, label, ...): label is a MathTex
+            label = node.args[1] if len(node.args) > 1 else None
+            if isinstance(label, ast.Constant) and isinstance(label.value, str):
+                found.append(("MathTex", [label.value], {}))
+            continue
+        if not strings or len(strings) != len(node.args):
+            continue
+        # keywords that can be evaluated in manim's namespace (colors, constants)
+        keywords = {
+            keyword.arg: ast.unparse(keyword.value) for keyword in node.keywords
+            if keyword.arg and isinstance(keyword.value, (ast.Constant, ast.Name))
+        }
+        found.append((name, strings, keywords))
+    return found
+
+
+def get_warm_up_items():
+    items = {("MathTex", (char,), ()) for char in GLYPHS}
+    for path in SCENE_MODULES + ("mobjects.py",):
+        for name, strings, keywords in find_strings(os.path.join(ROOT, path)):
+            items.add((name, tuple(strings), tuple(sorted(keywords.items()))))
+    return sorted(items)
+
+
+def compile_items(items, media_dir):
+    # run in a separate process: typeset `items` with manim, SVGs go to media_dir
+    import manim
+    from manim import config
+
+    config.media_dir = media_dir
+    namespace = vars(manim)
+    for name, strings, keywords in items:
+        try:
+            kwargs = {key: eval(source, namespace) for key, source in keywords}
+            getattr(manim, name)(*strings, **kwargs)
+        except Exception as e:
+            print(f"{name}{tuple(strings)}: {e}", file=sys.stderr)
+
+
+def warm(n_jobs):
+    items = get_warm_up_items()
+    with tempfile.TemporaryDirectory() as tmp:
+        workers = []
+        for i in range(n_jobs):
+            media_dir = os.path.join(tmp, str(i))
+            restore(media_dir)
+            share = json.dumps(items[i::n_jobs])
+            workers.append((media_dir, subprocess.Popen(
+                [sys.executable, __file__, "compile", media_dir],
+                stdin=subprocess.PIPE, text=True
+            )))
+            workers[-1][1].stdin.write(share)
+            workers[-1][1].stdin.close()
+        n_new = 0
+        for media_dir, worker in workers:
+            worker.wait()
+            n_new += publish(media_dir)
+    print(f"{len(items)} strings, {n_new} new SVGs in {CACHE_DIR}")
+
+
+def status():
+    for subdir in SUBDIRS:
+        path = os.path.join(CACHE_DIR, subdir)
+        n = len([name for name in os.listdir(path) if name.endswith(".svg")]) if os.path.isdir(path) else 0
+        print(f"{path}: {n} SVGs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["warm", "status", "compile"])
+    parser.add_argument("media_dir", nargs="?", help="compile: media dir of this worker")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    if args.command == "compile":
+        compile_items(json.load(sys.stdin), args.media_dir)
+    elif args.command == "warm":
+        warm(args.jobs)
+    else:
+        status()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
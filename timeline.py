@@ -0,0 +1,80 @@
+"""
+Per-frame tables of functions of a ValueTracker
+
+before each play() of a tracker, the tracker value of every frame is computed
+from the rate function, and every function of the table is evaluated on all of
+them in one vectorized call; updaters then only look up the current frame's row.
+frames are played in order, so the row is the one of the previous lookup or
+the next one; the table is only searched when neither matches (the first
+lookup of a play, a frame range starting mid-play, a value set by another
+animation)
+"""
+
+import numpy as np
+
+
+class TrackerTable:
+    # functions: name -> vectorized function of an array of tracker values,
+    #   returning an array with one row per value
+    #
+    #   x_table = TrackerTable(x_tracker, pos=lambda xs: coords_to_points(plane, xs, ic.f(xs)))
+    #   dot.add_updater(lambda d: d.move_to(x_table.get("pos")))
+    #   x_table.play(self, 5, run_time=2)
+    def __init__(self, tracker, **functions):
+        self.tracker = tracker
+        self.functions = functions
+        self.set_values([tracker.get_value()])
+        self.hits = 0
+        self.misses = 0
+
+    def set_values(self, values):
+        self.values = np.asarray(values, dtype=float)
+        self.tables = {name: np.asarray(f(self.values)) for name, f in self.functions.items()}
+        # row of the last lookup
+        self.row = 0
+
+    def is_row(self, i, value):
+        return i < len(self.values) and abs(self.values[i] - value) <= 1e-9*(1 + abs(value))
+
+    def find_row(self, value):
+        # row of `value`, None if it is not in the table
+        for i in (self.row, self.row + 1):
+            if self.is_row(i, value):
+                self.row = i
+                return i
+        i = int(np.argmin(np.abs(self.values - value)))
+        if self.is_row(i, value):
+            self.row = i
+            return i
+        return None
+
+    def prepare(self, end, run_time=1, rate_func=None):
+        # tables for play(tracker.animate.set_value(end), run_time=run_time, rate_func=rate_func)
+        from manim import config, smooth
+        rate_func = rate_func or smooth
+
+        times = np.arange(0, run_time, 1/config.frame_rate)
+        alphas = np.append(times/run_time, 1)
+        # rate functions take one number at a time, this is the only per-frame python call
+        alphas = np.array([rate_func(alpha) for alpha in alphas])
+        start = self.tracker.get_value()
+        self.set_values(start + (end - start)*alphas)
+        return self
+
+    def play(self, scene, end, run_time=1, rate_func=None, **kwargs):
+        from manim import smooth
+        rate_func = rate_func or smooth
+        self.prepare(end, run_time, rate_func)
+        scene.play(self.tracker.animate.set_value(end), run_time=run_time, rate_func=rate_func, **kwargs)
+
+    def get(self, name, value=None):
+        # row of table `name` for the tracker's current value
+        # (computed directly if the value is not in the table, e.g. set by another animation)
+        if value is None:
+            value = self.tracker.get_value()
+        i = self.find_row(value)
+        if i is not None:
+            self.hits += 1
+            return self.tables[name][i]
+        self.misses += 1
+        return np.asarray(self.functions[name](np.array([value])))[0]